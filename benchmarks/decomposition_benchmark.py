@@ -0,0 +1,102 @@
+"""
+Decomposition solver benchmark
+
+Solves position-separable SBCs on synthetic card pools of growing size, once with
+CP-SAT, once with the decomposition solver and once letting the solver route, and
+compares end to end latency: solver construction, constraints and solve. All
+engines are exact, so total prices must match.
+
+The "light" spec has small constraint bounds, the dynamic program is cheap. The
+"heavy" spec has a large state space, the dynamic program is slower than CP-SAT
+and should be routed to it. Decomposition seconds per state update and CP-SAT
+seconds per card printed here calibrate the routing constants of EaFcSbcSolver.
+
+Usage:
+    python benchmarks/decomposition_benchmark.py [--sizes 1000 5000 20000]
+"""
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.sbc_solver.ea_fc_sbc_solver import EaFcSbcSolver  # noqa: E402
+from src.utils.formations import Formations  # noqa: E402
+
+POSITIONS = ["GK", "LB", "CB", "RB", "LM", "CM", "RM", "ST"]
+VERSIONS = ["BRONZE", "SILVER", "GOLD", "RARE GOLD", "TOTW"]
+
+
+def generate_cards(no_cards):
+    rng = random.Random(0)
+    return pd.DataFrame([
+        {
+            "ID": i, "Name": f"Player {i}", "Position": rng.choice(POSITIONS), "OverallRating": rng.randint(60, 92),
+            "Version": rng.choice(VERSIONS), "Price": rng.randint(200, 100000), "League": f"League {rng.randint(1, 30)}",
+            "Nationality": f"Nation {rng.randint(1, 60)}", "Club": f"Club {rng.randint(1, 300)}", "Futwiz": "",
+        }
+        for i in range(no_cards)
+    ])
+
+
+SPECS = {
+    "light": [
+        ("min_overall_of_squad", (84,)), ("min_rare_cards", (3,)), ("min_cards_with_nation", ("Nation 1", 1)),
+        ("min_cards_with_overall", (2, 86)),
+    ],
+    "heavy": [
+        ("min_overall_of_squad", (86,)), ("min_rare_cards", (7,)), ("min_cards_with_version", ("GOLD", 4)),
+        ("min_cards_with_overall", (5, 88)), ("min_cards_with_league", ("League 1", 3)),
+    ],
+}
+
+
+def create_solver(cards_df, spec):
+    sbc_solver = EaFcSbcSolver(cards_df, Formations.F4_4_2.value)
+    for constraint, args in spec:
+        getattr(sbc_solver, f"set_{constraint}")(*args)
+    return sbc_solver
+
+
+def solve(cards_df, spec, use_decomposition=True, force_decomposition=False):
+    start_time = time.perf_counter()
+    sbc_solver = create_solver(cards_df, spec)
+    with contextlib.redirect_stdout(io.StringIO()):
+        if force_decomposition:
+            cards = sbc_solver._solve_with_decomposition(sbc_solver._create_decomposition_solver(), time.time())
+        else:
+            cards = sbc_solver.solve(use_decomposition=use_decomposition)
+    elapsed = time.perf_counter() - start_time
+    return sum(int(card["Price"]) for card in cards), elapsed, sbc_solver.get_solve_stats()["engine"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 20000],
+                        help="number of cards in generated pools")
+    args = parser.parse_args()
+
+    print(f"{'Cards':>8} {'Spec':>6} {'CP-SAT s':>9} {'Decomp. s':>10} {'Routed s':>9} {'Engine':>14} "
+          f"{'ns/update':>10} {'us/card':>8} {'Price':>8}")
+    for no_cards in args.sizes:
+        cards_df = generate_cards(no_cards)
+        for spec_name, spec in SPECS.items():
+            cp_sat_price, cp_sat_time, _ = solve(cards_df, spec, use_decomposition=False)
+            decomposition_price, decomposition_time, _ = solve(cards_df, spec, force_decomposition=True)
+            routed_price, routed_time, engine = solve(cards_df, spec)
+            assert cp_sat_price == decomposition_price == routed_price, \
+                f"Price mismatch: {cp_sat_price}, {decomposition_price}, {routed_price}"
+            no_state_updates = create_solver(cards_df, spec)._create_decomposition_solver().get_no_state_updates()
+            print(f"{no_cards:>8} {spec_name:>6} {cp_sat_time:>9.3f} {decomposition_time:>10.3f} {routed_time:>9.3f} "
+                  f"{engine:>14} {decomposition_time / no_state_updates * 1e9:>10.2f} "
+                  f"{cp_sat_time / no_cards * 1e6:>8.1f} {routed_price:>8}")
+
+
+if __name__ == "__main__":
+    main()
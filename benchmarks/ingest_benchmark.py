@@ -0,0 +1,85 @@
+"""
+Streaming ingest benchmark
+
+Generates synthetic CSV and JSON Lines player dumps of growing size, streams them
+into a temporary cache with FC26DataProvider.ingest_dump and reports throughput
+and peak traced memory. Peak memory should stay flat as the dump grows.
+
+Usage:
+    python benchmarks/ingest_benchmark.py [--sizes 100000 300000 1000000]
+"""
+import argparse
+import csv
+import json
+import os
+import random
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.data.fc26_data_provider import FC26DataProvider  # noqa: E402
+
+POSITIONS = ["GK", "LB", "CB", "RB", "LM", "CM", "CDM", "CAM", "RM", "LW", "RW", "ST"]
+VERSIONS = ["BRONZE", "SILVER", "GOLD", "RARE GOLD", "TOTW", "TOTS", "ICON", "HERO"]
+SEASONS = ["FC24", "FC25", "FC26"]
+HEADERS = ["ID", "Name", "Position", "OverallRating", "Version", "Price", "League", "Nationality", "Club",
+           "Futwiz", "Season"]
+
+
+def generate_rows(no_rows):
+    rng = random.Random(0)
+    for i in range(no_rows):
+        yield [i, f"Player {i}", rng.choice(POSITIONS), rng.randint(45, 99), rng.choice(VERSIONS),
+               rng.randint(200, 500000), f"League {rng.randint(1, 50)}", f"Nation {rng.randint(1, 150)}",
+               f"Club {rng.randint(1, 700)}", "", rng.choice(SEASONS)]
+
+
+def write_csv(path, no_rows):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(HEADERS)
+        writer.writerows(generate_rows(no_rows))
+
+
+def write_json_lines(path, no_rows):
+    with open(path, 'w') as f:
+        for row in generate_rows(no_rows):
+            f.write(json.dumps(dict(zip(HEADERS, row))) + "\n")
+
+
+def measure(provider, path):
+    tracemalloc.start()
+    stats = provider.ingest_dump(path, seasons=["FC26"], max_price=50000, min_rating=75)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return stats, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100000, 300000, 1000000],
+                        help="number of rows of generated dumps")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        provider = FC26DataProvider(cache_dir=os.path.join(tmp_dir, "cache"))
+        results = []
+        for no_rows in args.sizes:
+            for extension, write_dump in ((".csv", write_csv), (".jsonl", write_json_lines)):
+                path = os.path.join(tmp_dir, f"dump_{no_rows}{extension}")
+                write_dump(path, no_rows)
+                stats, peak = measure(provider, path)
+                results.append((extension, no_rows, os.path.getsize(path), stats, peak))
+                os.remove(path)
+
+    print()
+    print(f"{'Format':<8} {'Rows':>10} {'File MB':>9} {'Kept':>8} {'Rows/s':>10} {'Peak MB':>9}")
+    for extension, no_rows, file_size, stats, peak in results:
+        print(f"{extension:<8} {no_rows:>10} {file_size / 2 ** 20:>9.1f} {stats['rows_kept']:>8} "
+              f"{stats['rows_per_second']:>10.0f} {peak / 2 ** 20:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
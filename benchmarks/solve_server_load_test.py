@@ -0,0 +1,89 @@
+"""
+Load test for the local HTTP solve server
+
+Sends SBC specs from several concurrent clients, each reusing one keep-alive
+connection, and reports requests/s and latency percentiles. Start the server
+first with `python server_fc26.py`.
+
+Usage:
+    python benchmarks/solve_server_load_test.py [--clients 8] [--requests 50] [--distinct-specs 4]
+"""
+import argparse
+import http.client
+import json
+import statistics
+import threading
+import time
+
+
+def make_specs(no_distinct_specs):
+    # Distinct specs differ in squad rating, duplicates exercise request coalescing
+    return [
+        {
+            "formation": "4-1-3-2",
+            "constraints": [
+                {"constraint": "min_overall_of_squad", "args": [60 + i]},
+                {"constraint": "min_unique_nations", "args": [4]},
+            ],
+        }
+        for i in range(no_distinct_specs)
+    ]
+
+
+def run_client(host, port, specs, no_requests, client_id, latencies, errors, coalesced):
+    connection = http.client.HTTPConnection(host, port)
+    for i in range(no_requests):
+        body = json.dumps(specs[(client_id + i) % len(specs)])
+        start_time = time.perf_counter()
+        connection.request("POST", "/solve", body=body, headers={"Content-Type": "application/json"})
+        response = connection.getresponse()
+        payload = json.loads(response.read())
+        latencies.append(time.perf_counter() - start_time)
+        if response.status != 200:
+            errors.append(payload.get("error"))
+        elif payload["metrics"]["coalesced"]:
+            coalesced.append(1)
+    connection.close()
+
+
+def percentile(sorted_values, fraction):
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8026)
+    parser.add_argument("--clients", type=int, default=8, help="concurrent clients (default: 8)")
+    parser.add_argument("--requests", type=int, default=50, help="requests per client (default: 50)")
+    parser.add_argument("--distinct-specs", type=int, default=4, help="number of different specs (default: 4)")
+    args = parser.parse_args()
+
+    specs = make_specs(args.distinct_specs)
+    latencies, errors, coalesced = [], [], []
+    threads = [
+        threading.Thread(target=run_client,
+                         args=(args.host, args.port, specs, args.requests, i, latencies, errors, coalesced))
+        for i in range(args.clients)
+    ]
+
+    start_time = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start_time
+
+    latencies.sort()
+    print(f"Requests:     {len(latencies)} ({len(errors)} errors, {len(coalesced)} coalesced)")
+    print(f"Throughput:   {len(latencies) / elapsed:.1f} requests/s")
+    print(f"Latency mean: {statistics.mean(latencies) * 1000:.1f} ms")
+    for name, fraction in (("p50", 0.5), ("p90", 0.9), ("p99", 0.99)):
+        print(f"Latency {name}:  {percentile(latencies, fraction) * 1000:.1f} ms")
+    print(f"Latency max:  {latencies[-1] * 1000:.1f} ms")
+    if errors:
+        print(f"First error:  {errors[0]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Startup benchmark for the CLI and the GUI
+
+Measures wall time of `python main_fc26.py --help`, the import time of the GUI
+module and, when a display is available, the time until the first GUI paint.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--runs N]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+GUI_IMPORT_SNIPPET = "import gui_interface"
+
+GUI_FIRST_PAINT_SNIPPET = """
+import time
+start = time.perf_counter()
+import tkinter as tk
+import gui_interface
+root = tk.Tk()
+gui_interface.FC26BotGUI(root)
+root.update()
+print(time.perf_counter() - start)
+root.destroy()
+"""
+
+
+def run_python(args):
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable] + args, cwd=REPO_DIR, capture_output=True, text=True)
+    return time.perf_counter() - start, result
+
+
+def measure(name, args, runs):
+    timings = []
+    for _ in range(runs):
+        elapsed, result = run_python(args)
+        if result.returncode != 0:
+            print(f"{name:<28} skipped: {result.stderr.strip().splitlines()[-1]}")
+            return
+        timings.append(elapsed)
+    print(f"{name:<28} median {statistics.median(timings) * 1000:8.1f} ms   "
+          f"min {min(timings) * 1000:8.1f} ms   ({runs} runs)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="number of runs per measurement (default: 10)")
+    args = parser.parse_args()
+
+    measure("python -c pass (baseline)", ["-c", "pass"], args.runs)
+    measure("main_fc26.py --help", ["main_fc26.py", "--help"], args.runs)
+    measure("import gui_interface", ["-c", GUI_IMPORT_SNIPPET], args.runs)
+    # Includes interpreter startup, Tk may be missing on headless machines
+    measure("GUI first paint", ["-c", GUI_FIRST_PAINT_SNIPPET], args.runs)
+
+
+if __name__ == "__main__":
+    main()
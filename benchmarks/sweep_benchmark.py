@@ -0,0 +1,87 @@
+"""
+Squad rating sweep benchmark
+
+Solves one SBC for a range of minimum squad ratings on a synthetic card pool, once
+with sweep_min_overall_of_squad and once with a fresh solver per rating, and compares
+total time and per level prices. The spec has a unique nations constraint, so every
+level is solved by CP-SAT.
+
+Usage:
+    python benchmarks/sweep_benchmark.py [--cards 5000] [--ratings 80 89]
+"""
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.decomposition_benchmark import generate_cards  # noqa: E402
+from src.sbc_solver.ea_fc_sbc_solver import EaFcSbcSolver  # noqa: E402
+from src.sbc_solver.exceptions import NoSolutionFound  # noqa: E402
+from src.utils.formations import Formations  # noqa: E402
+
+MIN_UNIQUE_NATIONS = 4
+
+
+def create_solver(cards_df):
+    sbc_solver = EaFcSbcSolver(cards_df, Formations.F4_4_2.value)
+    sbc_solver.set_min_unique_nations(MIN_UNIQUE_NATIONS)
+    return sbc_solver
+
+
+def sweep(cards_df, min_overalls):
+    start_time = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        frontier = create_solver(cards_df).sweep_min_overall_of_squad(min_overalls)
+    elapsed = time.perf_counter() - start_time
+    # Points dominated by a higher rating at the same price are dropped from the frontier,
+    # infeasible ratings have no point
+    prices = {}
+    for point in frontier:
+        for min_overall in min_overalls:
+            if min_overall <= point["min_overall"]:
+                prices.setdefault(min_overall, point["price"])
+    return prices, elapsed
+
+
+def solve_separately(cards_df, min_overalls):
+    prices = {}
+    start_time = time.perf_counter()
+    for min_overall in min_overalls:
+        sbc_solver = create_solver(cards_df)
+        sbc_solver.set_min_overall_of_squad(min_overall)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                cards = sbc_solver.solve()
+        except NoSolutionFound:
+            continue
+        prices[min_overall] = sum(int(card["Price"]) for card in cards)
+    return prices, time.perf_counter() - start_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--cards", type=int, default=5000, help="number of cards in the generated pool")
+    parser.add_argument("--ratings", type=int, nargs=2, default=[80, 89], metavar=("MIN", "MAX"),
+                        help="range of minimum squad ratings to sweep")
+    args = parser.parse_args()
+
+    cards_df = generate_cards(args.cards)
+    min_overalls = list(range(args.ratings[0], args.ratings[1] + 1))
+    sweep_prices, sweep_time = sweep(cards_df, min_overalls)
+    separate_prices, separate_time = solve_separately(cards_df, min_overalls)
+
+    print(f"{'Rating':>7} {'Price':>8}")
+    for min_overall in min_overalls:
+        sweep_price, separate_price = sweep_prices.get(min_overall), separate_prices.get(min_overall)
+        assert sweep_price == separate_price, f"Price mismatch at {min_overall}: {sweep_price}, {separate_price}"
+        print(f"{min_overall:>7} {separate_price if separate_price is not None else 'none':>8}")
+    print(f"Sweep: {sweep_time:.2f}s, separate solves: {separate_time:.2f}s, "
+          f"speedup: {separate_time / sweep_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,7 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import threading
-from src.data.fc26_data_provider import FC26DataProvider
-from src.sbc_solver.ea_fc_sbc_solver import EaFcSbcSolver
 from src.utils.formations import Formations
-from src.solution_display.console_display import SbcSolutionConsoleDisplay
-import pandas as pd
 
 
 class FC26BotGUI:
@@ -16,14 +12,12 @@ class FC26BotGUI:
         self.root.resizable(True, True)
         
         # Variables
-        self.dataset = None
+        # Provider is created on first solve, it keeps already loaded positions in memory
+        self.provider = None
         self.solution = None
         
         # Create UI
         self.create_widgets()
-        
-        # Load data in background
-        self.load_data()
     
     def create_widgets(self):
         # Main frame
@@ -96,33 +90,7 @@ class FC26BotGUI:
         # Output text area
         self.output_text = scrolledtext.ScrolledText(main_frame, height=20)
         self.output_text.grid(row=5, column=0, columnspan=3, sticky=tk.W+tk.E+tk.N+tk.S)
-        self.output_text.insert(tk.END, "Welcome to FC26 SBC Solver!\nData is loading in the background...\n")
-    
-    def load_data(self):
-        """Load player data in a separate thread"""
-        def load():
-            try:
-                self.progress.start()
-                provider = FC26DataProvider()
-                self.dataset = provider.get_players_data(source="auto")
-                self.root.after(0, self.on_data_loaded)
-            except Exception as e:
-                self.root.after(0, self.on_data_error, str(e))
-        
-        threading.Thread(target=load, daemon=True).start()
-    
-    def on_data_loaded(self):
-        """Called when data loading is complete"""
-        self.progress.stop()
-        self.output_text.insert(tk.END, f"Data loaded successfully! {len(self.dataset) if self.dataset is not None else 0} players available.\n")
-        self.output_text.see(tk.END)
-        self.solve_button.config(state=tk.NORMAL)
-    
-    def on_data_error(self, error_msg):
-        """Called when data loading fails"""
-        self.progress.stop()
-        self.output_text.insert(tk.END, f"Error loading data: {error_msg}\n")
-        self.output_text.see(tk.END)
+        self.output_text.insert(tk.END, "Welcome to FC26 SBC Solver!\nPlayer data is loaded on demand for the selected formation.\n")
     
     def get_selected_formation(self):
         """Convert selected formation to the appropriate format"""
@@ -143,19 +111,26 @@ class FC26BotGUI:
     
     def solve_sbc(self):
         """Solve the SBC with current settings"""
-        if self.dataset is None:
-            messagebox.showerror("Error", "Data not loaded yet. Please wait.")
-            return
-        
         def solve():
             try:
                 self.root.after(0, self.on_solve_start)
                 
+                # Heavy modules are imported off the UI thread on first solve
+                from src.data.fc26_data_provider import FC26DataProvider
+                from src.sbc_solver.ea_fc_sbc_solver import EaFcSbcSolver
+                from src.solution_display.console_display import SbcSolutionConsoleDisplay
+                
                 # Get formation
                 formation = self.get_selected_formation()
                 
+                # Load only the cards for positions of the selected formation
+                if self.provider is None:
+                    self.provider = FC26DataProvider()
+                dataset = self.provider.get_players_data(source="auto", positions=formation)
+                self.root.after(0, self.on_data_loaded, len(dataset))
+                
                 # Create solver
-                sbc_solver = EaFcSbcSolver(self.dataset, formation)
+                sbc_solver = EaFcSbcSolver(dataset, formation)
                 
                 # Apply constraints
                 min_overall = int(self.min_overall_var.get())
@@ -194,6 +169,11 @@ class FC26BotGUI:
         
         threading.Thread(target=solve, daemon=True).start()
     
+    def on_data_loaded(self, no_players):
+        """Called when data for the selected formation is loaded"""
+        self.output_text.insert(tk.END, f"Data loaded successfully! {no_players} players available.\n")
+        self.output_text.see(tk.END)
+    
     def on_solve_start(self):
         """Called when solving starts"""
         self.solve_button.config(state=tk.DISABLED)
@@ -224,6 +204,8 @@ class FC26BotGUI:
             return
         
         try:
+            import pandas as pd
+            
             # Create a DataFrame from the solution
             # Convert solution cards to dictionaries
             solution_dicts = []
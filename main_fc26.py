@@ -1,20 +1,40 @@
-from src.data.fc26_data_provider import FC26DataProvider
-from src.sbc_solver.ea_fc_sbc_solver import EaFcSbcSolver
+import argparse
+import os
+
 from src.utils.formations import Formations
-from src.solution_display.console_display import SbcSolutionConsoleDisplay
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Solve an EA FC 26 SBC with the cheapest set of cards")
+    parser.add_argument("--source", default="auto", choices=["auto", "futbin", "futdb", "csv"],
+                        help="player data source (default: auto)")
+    parser.add_argument("--portfolio", action="store_true",
+                        help="race several solver configurations and learn the fastest one per SBC type")
+    return parser.parse_args()
 
 
 def main():
+    args = parse_args()
+
+    # Heavy modules (pandas, ortools) are imported only once we actually solve
+    from src.data.fc26_data_provider import FC26DataProvider
+    from src.sbc_solver.ea_fc_sbc_solver import EaFcSbcSolver
+    from src.sbc_solver.portfolio import SolverPortfolio
+    from src.solution_display.console_display import SbcSolutionConsoleDisplay
+
+    # Define formation
+    formation = Formations.F4_1_3_2.value  # Using 4-1-3-2 formation that matches our dataset
+
     # Initialize the data provider
     print("Initializing FC26 Data Provider...")
     provider = FC26DataProvider()
+    portfolio = None
+    if args.portfolio:
+        portfolio = SolverPortfolio(stats_file=os.path.join(provider.cache_dir, "solver_portfolio_stats.json"))
     
-    # Get players data (automatically selects best source)
+    # Get players data, only for the positions the formation needs
     print("Fetching player data...")
-    dataset = provider.get_players_data(source="auto")
-    
-    # Define formation
-    formation = Formations.F4_1_3_2.value  # Using 4-1-3-2 formation that matches our dataset
+    dataset = provider.get_players_data(source=args.source, positions=formation)
     
     # Create solver instance
     print("Creating SBC solver...")
@@ -30,7 +50,7 @@ def main():
     try:
         # Solve the SBC
         print("Solving SBC...")
-        sbc_cards = sbc_solver.solve()
+        sbc_cards = sbc_solver.solve(portfolio=portfolio)
         
         # Display solution
         print("Displaying solution...")
@@ -44,4 +64,4 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
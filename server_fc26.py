@@ -0,0 +1,39 @@
+import argparse
+import os
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run a local HTTP server solving EA FC 26 SBCs")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8026, help="port to listen on (default: 8026)")
+    parser.add_argument("--source", default="auto", choices=["auto", "futbin", "futdb", "csv"],
+                        help="player data source (default: auto)")
+    parser.add_argument("--portfolio", action="store_true",
+                        help="race several solver configurations and learn the fastest one per SBC type")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    from src.data.fc26_data_provider import FC26DataProvider
+    from src.sbc_solver.portfolio import SolverPortfolio
+    from src.solve_server.http_solve_server import SbcSolveService, create_server
+
+    provider = FC26DataProvider()
+    portfolio = None
+    if args.portfolio:
+        portfolio = SolverPortfolio(stats_file=os.path.join(provider.cache_dir, "solver_portfolio_stats.json"))
+
+    server = create_server(SbcSolveService(provider, source=args.source, portfolio=portfolio), args.host, args.port)
+    print(f"Serving SBC solver on http://{args.host}:{args.port} (POST /solve, GET /health)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+import aiohttp
+
+
+class FetchError(Exception):
+    """Exception raised when a URL could not be fetched after all retries"""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class _RetryableResponse(Exception):
+    def __init__(self, status: int, retry_after: Optional[float]):
+        super().__init__(f"HTTP {status}")
+        self.retry_after = retry_after
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter
+
+    Allows bursts of up to `capacity` requests and `rate` requests per second on average.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last_refill) * self.rate)
+                self._last_refill = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AsyncJsonFetcher:
+    """
+    Concurrent fetcher for JSON APIs
+
+    Used as an async context manager. All requests share one pooled HTTP session, go
+    through a token bucket rate limiter and are retried with exponential backoff on
+    connection errors, HTTP 429 and 5xx.
+    """
+
+    _RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None, max_concurrent_requests: int = 8,
+                 requests_per_second: float = 5.0, max_retries: int = 5, backoff_s: float = 0.5,
+                 timeout_s: float = 30):
+        self.headers = headers or {}
+        self.max_concurrent_requests = max_concurrent_requests
+        self.requests_per_second = requests_per_second
+        self.max_retries = max_retries
+        self.backoff_s = backoff_s
+        self.timeout_s = timeout_s
+        self._session = None
+        self._rate_limiter = None
+
+    async def __aenter__(self):
+        self._rate_limiter = TokenBucket(self.requests_per_second)
+        connector = aiohttp.TCPConnector(limit=self.max_concurrent_requests)
+        timeout = aiohttp.ClientTimeout(total=self.timeout_s)
+        self._session = aiohttp.ClientSession(headers=self.headers, connector=connector, timeout=timeout)
+        return self
+
+    async def __aexit__(self, exc_type, exc, traceback):
+        await self._session.close()
+        self._session = None
+
+    async def run_concurrently(self, items: Iterable, handle: Callable[[Any], Awaitable[None]]):
+        """
+        Await `handle(item)` for every item, at most `max_concurrent_requests` at a time
+
+        The first exception raised by `handle` cancels the remaining items and is propagated.
+        """
+        queue = asyncio.Queue()
+        for item in items:
+            queue.put_nowait(item)
+
+        async def worker():
+            while not queue.empty():
+                await handle(queue.get_nowait())
+
+        workers = [asyncio.create_task(worker()) for _ in range(self.max_concurrent_requests)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+
+    async def fetch_pages(self, url: str, pages: Iterable[int], on_page: Callable[[int, dict], None],
+                          page_param: str = "page"):
+        """
+        Fetch given pages of a paginated URL concurrently
+
+        Args:
+            url: paginated URL
+            pages: page numbers to fetch
+            on_page: called with (page, payload) as soon as each page arrives, in completion order
+            page_param: query parameter holding the page number
+        """
+        async def fetch_page(page):
+            on_page(page, await self.fetch_json(url, {page_param: page}))
+
+        await self.run_concurrently(pages, fetch_page)
+
+    async def fetch_json(self, url: str, params: Optional[dict] = None):
+        """Fetch a single URL and decode its JSON body"""
+        for attempt in range(self.max_retries + 1):
+            await self._rate_limiter.acquire()
+            retry_after = None
+            try:
+                async with self._session.get(url, params=params) as response:
+                    if response.status in self._RETRYABLE_STATUSES:
+                        raise _RetryableResponse(response.status, self._parse_retry_after(response))
+                    response.raise_for_status()
+                    return await response.json(content_type=None)
+            except _RetryableResponse as e:
+                error = e
+                retry_after = e.retry_after
+            except aiohttp.ClientResponseError as e:
+                # Other 4xx responses won't get better by retrying
+                raise FetchError(f"Failed to fetch {url} {params or ''}: {e}", e.status) from e
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                error = e
+
+            if attempt == self.max_retries:
+                raise FetchError(f"Failed to fetch {url} {params or ''} after {self.max_retries + 1} attempts: "
+                                 f"{error}")
+            await asyncio.sleep(retry_after if retry_after is not None else self.backoff_s * 2 ** attempt)
+
+    def _parse_retry_after(self, response: aiohttp.ClientResponse) -> Optional[float]:
+        try:
+            return float(response.headers["Retry-After"])
+        except (KeyError, ValueError):
+            return None
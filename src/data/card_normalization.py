@@ -0,0 +1,55 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+from src.data.csv_headers import CsvHeaders, DerivedHeaders
+
+# Full version names, e.g. FutDB rarity names, and their canonical short forms
+VERSION_ALIASES = {
+    "TEAM OF THE WEEK": "TOTW",
+    "TEAM OF THE SEASON": "TOTS",
+    "TEAM OF THE YEAR": "TOTY",
+    "SQUAD BUILDING CHALLENGE": "SBC",
+    "FUT HEROES": "HERO",
+    "HEROES": "HERO",
+    "ICONS": "ICON",
+    "NON-RARE": "NON RARE",
+}
+# Plain versions without rare status, cards without a version are counted as common too
+_COMMON_VERSION_PATTERN = r"^(?:(?:(?:NON RARE|COMMON)(?: (?:BRONZE|SILVER|GOLD))?)|BRONZE|SILVER|GOLD)?$"
+# Plain rare versions, every other version is a special card, which is rare as well
+_RARE_VERSION_PATTERN = r"^RARE(?: (?:BRONZE|SILVER|GOLD))?$"
+_VERSION_ALIAS_PATTERN = re.compile(
+    r"\b(?:" + "|".join(re.escape(name) for name in sorted(VERSION_ALIASES, key=len, reverse=True)) + r")\b")
+
+
+def normalize_version(version: str) -> str:
+    """Canonical version name: upper case, single spaces, full names replaced by their short forms"""
+    version = " ".join(str(version).split()).upper()
+    return _VERSION_ALIAS_PATTERN.sub(lambda match: VERSION_ALIASES[match.group(0)], version)
+
+
+def normalize_cards(cards_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Canonicalize version names and add DerivedHeaders columns
+
+    All work is done with vectorized string operations, once per load. Cards which
+    already have all derived columns are returned as they are.
+    """
+    if all(str(header) in cards_df.columns for header in DerivedHeaders):
+        return cards_df
+
+    cards_df = cards_df.copy()
+    versions = (cards_df[str(CsvHeaders.Version)].fillna("").astype(str)
+                .str.strip().str.replace(r"\s+", " ", regex=True).str.upper()
+                .str.replace(_VERSION_ALIAS_PATTERN, lambda match: VERSION_ALIASES[match.group(0)], regex=True))
+    # Rarity tier follows from the version
+    tiers = np.select([versions.str.match(_COMMON_VERSION_PATTERN), versions.str.match(_RARE_VERSION_PATTERN)],
+                      ["COMMON", "RARE"], "SPECIAL")
+
+    cards_df[str(CsvHeaders.Version)] = versions
+    cards_df[str(DerivedHeaders.IsRare)] = tiers != "COMMON"
+    cards_df[str(DerivedHeaders.IsSpecial)] = tiers == "SPECIAL"
+    cards_df[str(DerivedHeaders.Tier)] = tiers
+    return cards_df
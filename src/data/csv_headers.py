@@ -0,0 +1,28 @@
+from enum import Enum
+
+
+class CsvHeaders(Enum):
+    ID = "ID"
+    Name = "Name"
+    Position = "Position"
+    OverallRating = "OverallRating"
+    Version = "Version"
+    Price = "Price"
+    League = "League"
+    Nationality = "Nationality"
+    Club = "Club"
+    Futwiz = "Futwiz"
+    
+    def __str__(self):
+        return self.value
+
+
+class DerivedHeaders(Enum):
+    """Columns computed from CsvHeaders columns when cards are loaded"""
+    IsRare = "IsRare"
+    IsSpecial = "IsSpecial"
+    # "COMMON", "RARE" or "SPECIAL"
+    Tier = "Tier"
+
+    def __str__(self):
+        return self.value
@@ -1,85 +1,190 @@
 import pandas as pd
+import asyncio
 import time
 import os
 import json
-from typing import Optional
-import requests
-from enum import Enum
-
-
-class CsvHeaders(Enum):
-    ID = "ID"
-    Name = "Name"
-    Position = "Position"
-    OverallRating = "OverallRating"
-    Version = "Version"
-    Price = "Price"
-    League = "League"
-    Nationality = "Nationality"
-    Club = "Club"
-    Futwiz = "Futwiz"
-    
-    def __str__(self):
-        return self.value
+import re
+import shutil
+from typing import Iterable, List, Optional
+
+from src.data.card_normalization import normalize_cards
+from src.data.csv_headers import CsvHeaders, DerivedHeaders
 
 
 class FC26DataProvider:
-    def __init__(self, cache_dir: str = "./cache"):
+    # Optional column of multi-season dumps
+    _SEASON_COLUMN = "Season"
+    # Page a fetched card came from, only kept in the cache
+    _PAGE_COLUMN = "SourcePage"
+    _NUMERIC_HEADERS = [str(CsvHeaders.ID), str(CsvHeaders.OverallRating), str(CsvHeaders.Price)]
+    # Whitespace and array punctuation between records of a JSON dump
+    _JSON_SEPARATORS = re.compile(r'[\s,\[\]]*')
+    # FutDB endpoints listing names of entities players refer to by id
+    _FUTDB_NAME_ENDPOINTS = {"league": "leagues", "nation": "nations", "club": "clubs", "rarity": "rarities"}
+    # Every source has its own cache, "auto" prefers them in this order
+    _CACHE_SOURCES = ["futdb", "dump", "csv"]
+    _CACHE_MANIFEST_FILE = "manifest.json"
+    # Bundled players data, cached in the "csv" cache
+    _CSV_FILE = "players.csv"
+
+    def __init__(self, cache_dir: str = "./cache", max_concurrent_requests: int = 8,
+                 requests_per_second: float = 5.0):
         self.cache_dir = cache_dir
         self.futbin_base_url = "https://www.futbin.com"
         self.futdb_base_url = "https://futdb.app/api"
-        self.cache_file = os.path.join(cache_dir, "fc26_players_cache.json")
+        # Platform whose FutDB prices are used
+        self.futdb_platform = "ps"
+        self.max_concurrent_requests = max_concurrent_requests
+        self.requests_per_second = requests_per_second
+        # Cache is kept per source and partitioned by position, one JSON Lines file per position
+        self.cache_partitions_dir = os.path.join(cache_dir, "fc26_players_cache")
+        # Pages already ingested by an unfinished FutDB fetch
+        self.ingest_checkpoint_file = os.path.join(cache_dir, "fc26_ingest_checkpoint.json")
+        # Partitions already read from disk, keyed by (cache source, position)
+        self._loaded_partitions = {}
         
         # Create cache directory if it doesn't exist
         if not os.path.exists(cache_dir):
             os.makedirs(cache_dir)
     
-    def get_players_data(self, source: str = "auto") -> pd.DataFrame:
+    def get_players_data(self, source: str = "auto", positions: Optional[Iterable[str]] = None,
+                         leagues: Optional[Iterable[str]] = None) -> pd.DataFrame:
         """
         Get players data from various sources
         
         Args:
-            source: "auto", "futbin", "futdb", or "csv"
+            source: "auto", "futbin", "futdb", or "csv", "auto" resumes an interrupted
+                FutDB fetch, or else uses the first complete cache
+            positions: only load cards playing one of these positions (all if None),
+                only partitions of these positions are read from the cache
+            leagues: only return cards from one of these leagues (all if None), applied
+                after the position partitions are loaded
             
         Returns:
             DataFrame with players data
         """
+        positions = None if positions is None else {str(position) for position in positions}
+        leagues = None if leagues is None else set(leagues)
+
         if source == "auto":
-            # Try to load from cache first
-            if os.path.exists(self.cache_file):
+            # Finish an interrupted FutDB fetch rather than falling back to another source
+            if os.path.exists(self.ingest_checkpoint_file) and os.environ.get("FUTDB_API_KEY"):
+                return self._fetch_from_futdb(positions, leagues)
+            # Try to load from a complete cache first, fetched data before dumps before the bundled CSV
+            for cache_source in self._CACHE_SOURCES:
+                if self._load_cache_manifest(cache_source) is None:
+                    continue
                 try:
-                    return self._load_from_cache()
-                except:
+                    if cache_source == "csv" and os.path.exists(self._CSV_FILE):
+                        # players.csv may have changed since it was cached
+                        self._ingest_dump_if_stale(self._CSV_FILE, "csv")
+                    return self._load_from_cache(cache_source, positions, leagues)
+                except (OSError, ValueError):
                     pass
             # If no cache, try futbin
             source = "futbin"
         
         if source == "futbin":
-            return self._fetch_from_futbin()
+            return self._fetch_from_futbin(positions, leagues)
         elif source == "futdb":
-            return self._fetch_from_futdb()
+            return self._fetch_from_futdb(positions, leagues)
         elif source == "csv":
-            return self._load_from_csv()
+            return self._load_from_csv(positions, leagues)
         else:
             raise ValueError(f"Unknown source: {source}")
     
-    def _load_from_cache(self) -> pd.DataFrame:
-        """Load players data from cache"""
-        with open(self.cache_file, 'r') as f:
-            data = json.load(f)
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(data)
-        return df
+    def _load_from_cache(self, cache_source: str, positions: Optional[set] = None,
+                         leagues: Optional[set] = None) -> pd.DataFrame:
+        """
+        Load players data from the cache of a source, reading only the partitions of requested positions
+
+        Partitions are per position only, so the league filter is applied to the loaded rows.
+        """
+        if positions is None:
+            positions = {os.path.splitext(file_name)[0] for file_name in os.listdir(self._get_cache_dir(cache_source))
+                         if file_name.endswith(".jsonl")}
+
+        frames = []
+        for position in sorted(positions):
+            key = (cache_source, position)
+            if key not in self._loaded_partitions:
+                partition_file = self._get_partition_file(cache_source, position)
+                if not os.path.exists(partition_file):
+                    continue
+                with open(partition_file, 'r') as f:
+                    partition_df = pd.DataFrame([json.loads(line) for line in f if line.strip()])
+                # Derived columns are computed again, caches written with older rules stay correct
+                derived_columns = [str(header) for header in DerivedHeaders]
+                self._loaded_partitions[key] = normalize_cards(
+                    partition_df.drop(columns=[self._PAGE_COLUMN] + derived_columns, errors="ignore"))
+            frames.append(self._loaded_partitions[key])
+
+        if not frames:
+            return normalize_cards(pd.DataFrame(columns=[str(header) for header in CsvHeaders]))
+
+        df = pd.concat(frames, ignore_index=True)
+        return self._filter_players(df, None, leagues)
     
-    def _save_to_cache(self, df: pd.DataFrame):
-        """Save players data to cache"""
-        # Convert DataFrame to dict for JSON serialization
-        data = df.to_dict('records')
-        with open(self.cache_file, 'w') as f:
+    def _save_to_cache(self, cache_source: str, df: pd.DataFrame, manifest: dict):
+        """Save players data to the cache of a source"""
+        self._clear_cache(cache_source)
+        self._append_to_cache(cache_source, df)
+        self._save_cache_manifest(cache_source, manifest)
+
+    def _append_to_cache(self, cache_source: str, df: pd.DataFrame):
+        """Normalize players data and append it to the position partitions of the cache of a source"""
+        if df.empty:
+            return
+
+        df = normalize_cards(df)
+        for position, position_df in df.groupby(str(CsvHeaders.Position)):
+            # Convert DataFrame to dict for JSON serialization
+            with open(self._get_partition_file(cache_source, position), 'a') as f:
+                f.writelines(json.dumps(record) + "\n" for record in position_df.to_dict('records'))
+            self._loaded_partitions.pop((cache_source, position), None)
+
+    def _clear_cache(self, cache_source: str):
+        """Remove the cache of a source, caches of other sources are kept"""
+        cache_dir = self._get_cache_dir(cache_source)
+        if os.path.exists(cache_dir):
+            shutil.rmtree(cache_dir)
+        os.makedirs(cache_dir)
+        self._loaded_partitions = {key: partition_df for key, partition_df in self._loaded_partitions.items()
+                                   if key[0] != cache_source}
+
+    def _get_cache_dir(self, cache_source: str) -> str:
+        return os.path.join(self.cache_partitions_dir, cache_source)
+
+    def _get_partition_file(self, cache_source: str, position: str) -> str:
+        return os.path.join(self._get_cache_dir(cache_source), f"{position}.jsonl")
+
+    def _load_cache_manifest(self, cache_source: str) -> Optional[dict]:
+        """Description of a complete cache of a source, None if it was never completed"""
+        manifest_file = os.path.join(self._get_cache_dir(cache_source), self._CACHE_MANIFEST_FILE)
+        if not os.path.exists(manifest_file):
+            return None
+        with open(manifest_file, 'r') as f:
+            return json.load(f)
+
+    def _save_cache_manifest(self, cache_source: str, manifest: dict):
+        # Written last, so a cache with a manifest is always complete
+        self._write_json_file(os.path.join(self._get_cache_dir(cache_source), self._CACHE_MANIFEST_FILE), manifest)
+
+    def _write_json_file(self, path: str, data: dict):
+        # Write to a temporary file first so a crash never leaves a corrupted file
+        tmp_file = path + ".tmp"
+        with open(tmp_file, 'w') as f:
             json.dump(data, f)
+        os.replace(tmp_file, path)
+
+    def _filter_players(self, df: pd.DataFrame, positions: Optional[set], leagues: Optional[set]) -> pd.DataFrame:
+        if positions is not None:
+            df = df[df[str(CsvHeaders.Position)].isin(positions)]
+        if leagues is not None:
+            df = df[df[str(CsvHeaders.League)].isin(leagues)]
+        return df.reset_index(drop=True)
     
-    def _fetch_from_futbin(self) -> pd.DataFrame:
+    def _fetch_from_futbin(self, positions: Optional[set] = None, leagues: Optional[set] = None) -> pd.DataFrame:
         """
         Fetch players data from FUTBIN (web scraping)
         Note: This is a simplified version. In a real implementation, you would need
@@ -93,10 +198,9 @@ class FC26DataProvider:
         
         # Try to load from existing CSV first
         try:
-            df = pd.read_csv("players.csv")
+            self._ingest_dump_if_stale(self._CSV_FILE, "csv")
             print("Loaded data from existing CSV file")
-            self._save_to_cache(df)
-            return df
+            return self._load_from_cache("csv", positions, leagues)
         except FileNotFoundError:
             # If no CSV, create sample data
             print("Creating sample FC26 data")
@@ -112,24 +216,375 @@ class FC26DataProvider:
                 "Club": ["Real Madrid", "Manchester City", "Bayern Munich", "Barcelona", "Liverpool"],
                 "Futwiz": ["", "", "", "", ""]
             }
-            df = pd.DataFrame(sample_data)
-            self._save_to_cache(df)
-            return df
+            self._save_to_cache("csv", pd.DataFrame(sample_data), {"sample": True})
+            return self._load_from_cache("csv", positions, leagues)
     
-    def _fetch_from_futdb(self) -> pd.DataFrame:
+    def _fetch_from_futdb(self, positions: Optional[set] = None, leagues: Optional[set] = None) -> pd.DataFrame:
         """
         Fetch players data from FutDB API
-        Note: Requires API key from https://futdb.app/
+        Note: Requires API key from https://futdb.app/ in FUTDB_API_KEY environment variable
         """
+        api_key = os.environ.get("FUTDB_API_KEY")
+        if not api_key:
+            print("FUTDB_API_KEY is not set, falling back to FUTBIN")
+            return self._fetch_from_futbin(positions, leagues)
+
         print("Fetching data from FutDB API...")
-        
-        # This is a placeholder implementation
-        # In a real implementation, you would call the FutDB API
-        return self._fetch_from_futbin()  # Fallback to FUTBIN for now
+        # aiohttp is only needed when actually fetching
+        from src.data.async_fetcher import AsyncJsonFetcher
+
+        fetcher = AsyncJsonFetcher(headers={"X-AUTH-TOKEN": api_key},
+                                   max_concurrent_requests=self.max_concurrent_requests,
+                                   requests_per_second=self.requests_per_second)
+        self._ingest_futdb(fetcher)
+        return self._load_from_cache("futdb", positions, leagues)
+
+    def _ingest_futdb(self, fetcher):
+        """
+        Stream all FutDB player pages into the futdb cache
+
+        Names of leagues, nations, clubs and rarities are fetched first. Every player page is
+        then fetched with the prices of its players and appended to the cache as soon as it
+        is complete. Completed pages are checkpointed, so an interrupted fetch resumes where
+        it stopped.
+        """
+        players_url = f"{self.futdb_base_url}/players"
+        checkpoint = self._load_ingest_checkpoint(players_url)
+        # Completed pages can't be skipped once their cached rows are gone
+        if checkpoint is not None and not os.path.isdir(self._get_cache_dir("futdb")):
+            checkpoint = None
+        if checkpoint is None:
+            self._clear_cache("futdb")
+        else:
+            print(f"Resuming fetch, {len(checkpoint['completed_pages'])}/{checkpoint['page_count']} pages done")
+            # Pages being appended when the fetch stopped may be partly cached, they are fetched again
+            self._drop_incomplete_pages("futdb", set(checkpoint["completed_pages"]))
+
+        start_time = time.time()
+        checkpoint = asyncio.run(self._fetch_futdb_pages(fetcher, players_url, checkpoint))
+        self._save_cache_manifest("futdb", {"url": players_url, "page_count": checkpoint["page_count"]})
+        os.remove(self.ingest_checkpoint_file)
+
+        stats = checkpoint["stats"]
+        print(f"Fetched {checkpoint['page_count']} pages with {stats['players']} players "
+              f"in {time.time() - start_time:.1f}s")
+        if stats["dropped_without_price"]:
+            print(f"Dropped {stats['dropped_without_price']} of {stats['players']} players without a price")
+        if stats["unresolved_ids"]:
+            print(f"{stats['unresolved_ids']} league, nation, club or rarity ids could not be resolved to names")
+
+    async def _fetch_futdb_pages(self, fetcher, players_url: str, checkpoint: Optional[dict]) -> dict:
+        async with fetcher:
+            first_page = None
+            if checkpoint is None:
+                names = await self._fetch_futdb_names(fetcher)
+                # First page tells how many pages there are
+                first_page = await fetcher.fetch_json(players_url, {"page": 1})
+                checkpoint = {
+                    "url": players_url,
+                    "page_count": self._get_futdb_page_count(first_page),
+                    "completed_pages": [],
+                    "names": names,
+                    "stats": {"players": 0, "dropped_without_price": 0, "unresolved_ids": 0},
+                }
+                self._save_ingest_checkpoint(checkpoint)
+
+            completed_pages = set(checkpoint["completed_pages"])
+            pending_pages = [page for page in range(1, checkpoint["page_count"] + 1) if page not in completed_pages]
+
+            async def ingest_page(page):
+                if page == 1 and first_page is not None:
+                    payload = first_page
+                else:
+                    payload = await fetcher.fetch_json(players_url, {"page": page})
+                items = payload.get("items", [])
+                prices = await self._fetch_futdb_prices(fetcher, items)
+                # Counted only once the page is complete, so a resumed fetch doesn't count it twice
+                page_stats = {name: 0 for name in checkpoint["stats"]}
+                records = self._parse_futdb_page(payload, prices, checkpoint["names"], page_stats)
+                self._append_page_to_cache("futdb", page, records)
+                for name, value in page_stats.items():
+                    checkpoint["stats"][name] += value
+                checkpoint["completed_pages"].append(page)
+                self._save_ingest_checkpoint(checkpoint)
+
+            await fetcher.run_concurrently(pending_pages, ingest_page)
+        return checkpoint
+
+    async def _fetch_futdb_names(self, fetcher) -> dict:
+        """Names of related entities as {player field: {id: name}}"""
+        names = {}
+        for field, endpoint in self._FUTDB_NAME_ENDPOINTS.items():
+            url = f"{self.futdb_base_url}/{endpoint}"
+            first_page = await fetcher.fetch_json(url, {"page": 1})
+            payloads = [first_page]
+            await fetcher.fetch_pages(url, range(2, self._get_futdb_page_count(first_page) + 1),
+                                      lambda page, payload: payloads.append(payload))
+            names[field] = {str(item["id"]): item["name"]
+                            for payload in payloads for item in payload.get("items", [])}
+        return names
+
+    async def _fetch_futdb_prices(self, fetcher, items: List[dict]) -> dict:
+        """Prices of players listed without one, as {player id: price or None}"""
+        # aiohttp is only needed when actually fetching
+        from src.data.async_fetcher import FetchError
+
+        async def fetch_price(player_id):
+            try:
+                return self._get_futdb_price(
+                    await fetcher.fetch_json(f"{self.futdb_base_url}/players/{player_id}/price"))
+            except FetchError as e:
+                # Players that were never traded have no price
+                if e.status == 404:
+                    return None
+                raise
+
+        player_ids = [item["id"] for item in items if item.get("price") is None]
+        prices = await asyncio.gather(*(fetch_price(player_id) for player_id in player_ids))
+        return dict(zip(player_ids, prices))
+
+    def _get_futdb_price(self, payload) -> Optional[int]:
+        # Price is either a single value or one per platform: {"price": 1500} or {"ps": {"price": 1500}, ..}
+        if not isinstance(payload, dict):
+            return None
+        price = payload.get(self.futdb_platform, payload)
+        if isinstance(price, dict):
+            price = price.get("price")
+        try:
+            return int(price)
+        except (TypeError, ValueError):
+            return None
+
+    def _append_page_to_cache(self, cache_source: str, page: int, records: List[dict]):
+        page_df = pd.DataFrame(records)
+        page_df[self._PAGE_COLUMN] = page
+        self._append_to_cache(cache_source, page_df)
+
+    def _drop_incomplete_pages(self, cache_source: str, completed_pages: set):
+        """Remove cached rows of pages missing from the checkpoint"""
+        cache_dir = self._get_cache_dir(cache_source)
+        for file_name in os.listdir(cache_dir):
+            if not file_name.endswith(".jsonl"):
+                continue
+            partition_file = os.path.join(cache_dir, file_name)
+            with open(partition_file, 'r') as f:
+                lines = [line for line in f
+                         if line.strip() and json.loads(line).get(self._PAGE_COLUMN) in completed_pages]
+            tmp_file = partition_file + ".tmp"
+            with open(tmp_file, 'w') as f:
+                f.writelines(lines)
+            os.replace(tmp_file, partition_file)
+            self._loaded_partitions.pop((cache_source, os.path.splitext(file_name)[0]), None)
+
+    def _load_ingest_checkpoint(self, url: str) -> Optional[dict]:
+        if not os.path.exists(self.ingest_checkpoint_file):
+            return None
+        with open(self.ingest_checkpoint_file, 'r') as f:
+            checkpoint = json.load(f)
+        # A checkpoint of another source can't be resumed
+        return checkpoint if checkpoint.get("url") == url else None
+
+    def _save_ingest_checkpoint(self, checkpoint: dict):
+        self._write_json_file(self.ingest_checkpoint_file, checkpoint)
+
+    def _get_futdb_page_count(self, payload: dict) -> int:
+        return payload["pagination"]["pageTotal"]
+
+    def _parse_futdb_page(self, payload: dict, prices: dict, names: dict, stats: dict) -> List[dict]:
+        """
+        Convert FutDB players page to records with CsvHeaders keys
+
+        Args:
+            payload: players page
+            prices: prices of players listed without one, {player id: price or None}
+            names: names of related entities, {player field: {id: name}}
+            stats: counters "players", "dropped_without_price" and "unresolved_ids", updated in place
+        """
+        records = []
+        for item in payload.get("items", []):
+            stats["players"] += 1
+            price = item.get("price")
+            if price is None:
+                price = prices.get(item["id"])
+            # Cards without a known price can't take part in price optimisation
+            if price is None:
+                stats["dropped_without_price"] += 1
+                continue
+            records.append({
+                str(CsvHeaders.ID): item["id"],
+                str(CsvHeaders.Name): item.get("commonName") or item.get("name", ""),
+                str(CsvHeaders.Position): item["position"],
+                str(CsvHeaders.OverallRating): int(item["rating"]),
+                str(CsvHeaders.Version): self._get_futdb_name(item, "rarity", names, stats),
+                str(CsvHeaders.Price): int(price),
+                str(CsvHeaders.League): self._get_futdb_name(item, "league", names, stats),
+                str(CsvHeaders.Nationality): self._get_futdb_name(item, "nation", names, stats),
+                str(CsvHeaders.Club): self._get_futdb_name(item, "club", names, stats),
+                str(CsvHeaders.Futwiz): "",
+            })
+        return records
+
+    def _get_futdb_name(self, item: dict, field: str, names: dict, stats: dict) -> str:
+        # Related entities come either expanded ({"id": .., "name": ..}) or as bare ids
+        value = item.get(field, "")
+        if isinstance(value, dict):
+            return value.get("name", str(value.get("id", "")))
+        if value == "" or value is None:
+            return ""
+        name = names.get(field, {}).get(str(value))
+        if name is None:
+            stats["unresolved_ids"] += 1
+            return str(value)
+        return name
     
-    def _load_from_csv(self) -> pd.DataFrame:
+    def _load_from_csv(self, positions: Optional[set] = None, leagues: Optional[set] = None) -> pd.DataFrame:
         """Load players data from CSV file"""
-        return pd.read_csv("players.csv")
+        self._ingest_dump_if_stale(self._CSV_FILE, "csv")
+        return self._load_from_cache("csv", positions, leagues)
+
+    def _ingest_dump_if_stale(self, path: str, cache_source: str):
+        """Ingest the whole dump, unless the cache already holds this version of it"""
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Players dump not found: {path}")
+        manifest = self._load_cache_manifest(cache_source)
+        if manifest is None or manifest.get("dump") != self._get_dump_signature(path) or manifest.get("filters"):
+            self.ingest_dump(path, cache_source=cache_source)
+
+    def _get_dump_signature(self, path: str) -> dict:
+        stat = os.stat(path)
+        return {"path": os.path.abspath(path), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def ingest_dump(self, path: str, seasons: Optional[Iterable] = None, positions: Optional[Iterable[str]] = None,
+                    max_price: Optional[int] = None, min_rating: Optional[int] = None,
+                    max_rating: Optional[int] = None, chunk_size: int = 50000, cache_source: str = "dump") -> dict:
+        """
+        Stream a CSV, JSON or JSON Lines players dump into the cache
+
+        The file is read in chunks of `chunk_size` rows. Every chunk is type converted,
+        filtered and appended to the cache, so memory use doesn't grow with file size.
+        Previous content of the `cache_source` cache is replaced, caches of other sources are kept.
+
+        Args:
+            path: dump file, ".csv" is read as CSV, anything else as JSON array or JSON Lines
+            seasons: only keep cards from these seasons, needs a "Season" column in the dump
+            positions: only keep cards playing one of these positions
+            max_price: only keep cards not more expensive than this
+            min_rating: only keep cards rated at least this
+            max_rating: only keep cards rated at most this
+            chunk_size: number of rows processed at once
+            cache_source: cache to store the dump in, "auto" loads the "dump" cache
+                unless fetched FutDB data is cached
+
+        Returns:
+            Dict with "rows_read", "rows_kept", "seconds" and "rows_per_second"
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Players dump not found: {path}")
+
+        seasons = None if seasons is None else {str(season) for season in seasons}
+        positions = None if positions is None else {str(position) for position in positions}
+        filters = {
+            "seasons": None if seasons is None else sorted(seasons),
+            "positions": None if positions is None else sorted(positions),
+            "max_price": max_price,
+            "min_rating": min_rating,
+            "max_rating": max_rating,
+        }
+
+        self._clear_cache(cache_source)
+        start_time = time.time()
+        rows_read = 0
+        rows_kept = 0
+        for chunk in self._iter_dump_chunks(path, chunk_size):
+            rows_read += len(chunk)
+            chunk = self._prepare_dump_chunk(chunk, seasons, positions, max_price, min_rating, max_rating)
+            rows_kept += len(chunk)
+            self._append_to_cache(cache_source, chunk)
+        seconds = time.time() - start_time
+        self._save_cache_manifest(cache_source, {
+            "dump": self._get_dump_signature(path),
+            "filters": {name: value for name, value in filters.items() if value is not None},
+        })
+
+        rows_per_second = rows_read / seconds if seconds > 0 else float("inf")
+        print(f"Ingested {rows_kept} of {rows_read} rows from {path} in {seconds:.2f}s ({rows_per_second:.0f} rows/s)")
+        return {
+            "rows_read": rows_read,
+            "rows_kept": rows_kept,
+            "seconds": seconds,
+            "rows_per_second": rows_per_second,
+        }
+
+    def _iter_dump_chunks(self, path: str, chunk_size: int):
+        if path.lower().endswith(".csv"):
+            # Everything is read as text, types are converted per chunk
+            yield from pd.read_csv(path, chunksize=chunk_size, dtype=str, keep_default_na=False)
+            return
+
+        records = []
+        for record in self._iter_json_records(path):
+            records.append(record)
+            if len(records) == chunk_size:
+                yield pd.DataFrame(records)
+                records = []
+        if records:
+            yield pd.DataFrame(records)
+
+    def _iter_json_records(self, path: str, read_size: int = 1 << 20):
+        """Yield records of a JSON array or JSON Lines file without reading it whole"""
+        decoder = json.JSONDecoder()
+        buffer = ""
+        pos = 0
+        eof = False
+        with open(path, 'r') as f:
+            while True:
+                pos = self._JSON_SEPARATORS.match(buffer, pos).end()
+                if pos < len(buffer):
+                    try:
+                        record, pos = decoder.raw_decode(buffer, pos)
+                        yield record
+                        continue
+                    except json.JSONDecodeError:
+                        # Record is cut at the end of the buffer, unless the file is over
+                        if eof:
+                            raise
+                elif eof:
+                    return
+
+                chunk = f.read(read_size)
+                eof = not chunk
+                buffer = buffer[pos:] + chunk
+                pos = 0
+
+    def _prepare_dump_chunk(self, chunk: pd.DataFrame, seasons: Optional[set], positions: Optional[set],
+                            max_price: Optional[int], min_rating: Optional[int],
+                            max_rating: Optional[int]) -> pd.DataFrame:
+        if seasons is not None:
+            if self._SEASON_COLUMN not in chunk.columns:
+                raise ValueError(f"Dump has no {self._SEASON_COLUMN} column, can't filter by season")
+            chunk = chunk[chunk[self._SEASON_COLUMN].astype(str).isin(seasons)]
+
+        # Keep only card store columns, missing optional ones become empty strings
+        chunk = chunk.reindex(columns=[str(header) for header in CsvHeaders])
+        for header in self._NUMERIC_HEADERS:
+            chunk[header] = pd.to_numeric(chunk[header], errors="coerce")
+        # Rows without valid id, rating or price can't be used by the solver
+        chunk = chunk.dropna(subset=self._NUMERIC_HEADERS)
+        chunk = chunk.astype({header: "int64" for header in self._NUMERIC_HEADERS})
+        for header in CsvHeaders:
+            if str(header) not in self._NUMERIC_HEADERS:
+                chunk[str(header)] = chunk[str(header)].fillna("").astype(str)
+
+        mask = pd.Series(True, index=chunk.index)
+        if positions is not None:
+            mask &= chunk[str(CsvHeaders.Position)].isin(positions)
+        if max_price is not None:
+            mask &= chunk[str(CsvHeaders.Price)] <= max_price
+        if min_rating is not None:
+            mask &= chunk[str(CsvHeaders.OverallRating)] >= min_rating
+        if max_rating is not None:
+            mask &= chunk[str(CsvHeaders.OverallRating)] <= max_rating
+        return chunk[mask]
 
 
 # Example usage
@@ -0,0 +1,55 @@
+import numpy as np
+import pandas as pd
+
+from src.data.card_normalization import normalize_cards
+from src.data.csv_headers import CsvHeaders, DerivedHeaders
+
+from typing import Iterable
+
+
+class CardIndex:
+    """
+    Column arrays of a card pool, built once and shared by every solver of the pool
+
+    Leagues, nations and clubs are factorized into integer codes, so constraints select
+    matching cards with vectorized comparisons instead of row by row lookups.
+    """
+
+    def __init__(self, cards_df: pd.DataFrame):
+        # Cards loaded by FC26DataProvider are already normalized, this only costs for raw DataFrames
+        self.cards_df = normalize_cards(cards_df).reset_index(drop=True)
+        self.ids = self.cards_df[str(CsvHeaders.ID)].to_numpy()
+        self.positions = self.cards_df[str(CsvHeaders.Position)].astype(str).to_numpy()
+        self.ratings = self.cards_df[str(CsvHeaders.OverallRating)].to_numpy(dtype=np.int64)
+        self.prices = self.cards_df[str(CsvHeaders.Price)].to_numpy(dtype=np.int64)
+        self.versions = self.cards_df[str(CsvHeaders.Version)].to_numpy()
+        self.is_rare = self.cards_df[str(DerivedHeaders.IsRare)].to_numpy(dtype=bool)
+        self.league_codes, self.leagues = self._factorize(CsvHeaders.League)
+        self.nation_codes, self.nations = self._factorize(CsvHeaders.Nationality)
+        self.club_codes, self.clubs = self._factorize(CsvHeaders.Club)
+
+    def __len__(self):
+        return len(self.cards_df)
+
+    def for_positions(self, positions: Iterable[str]) -> "CardIndex":
+        """Index of the cards playing one of given positions, self if that are all cards"""
+        is_position = np.isin(self.positions, [str(position) for position in positions])
+        if is_position.all():
+            return self
+        return CardIndex(self.cards_df[is_position])
+
+    def get_league_code(self, league: str) -> int:
+        """Code of league, -1 if no card plays in it"""
+        return int(self.leagues.get_indexer([league])[0])
+
+    def get_nation_code(self, nation: str) -> int:
+        """Code of nation, -1 if no card has it"""
+        return int(self.nations.get_indexer([nation])[0])
+
+    def get_club_code(self, club: str) -> int:
+        """Code of club, -1 if no card plays for it"""
+        return int(self.clubs.get_indexer([club])[0])
+
+    def _factorize(self, header: CsvHeaders):
+        # Missing values get a code of their own, so every card has a valid code
+        return pd.factorize(self.cards_df[str(header)], use_na_sentinel=False)
@@ -0,0 +1,172 @@
+import numpy as np
+import src.sbc_solver.exceptions as SolverExceptions
+
+from collections import Counter
+from typing import List, Tuple
+
+
+class DecompositionSolver:
+    """
+    Exact solver for SBCs with only squad level aggregate constraints
+
+    Handles a minimum rating total and minimum counts of cards matching given predicates.
+    Every position is solved on its own into a frontier of cheapest card sets per
+    (rating total, counts) outcome, then a dynamic program over totals capped at their
+    required minimums combines the positions. The dynamic program keeps the cheapest
+    cost of reaching at least every combination of totals.
+    """
+
+    def __init__(self, positions: np.ndarray, ratings: np.ndarray, prices: np.ndarray, formation: List[str],
+                 min_rating_total: int, count_constraints: List[Tuple[np.ndarray, int]]):
+        """
+        Args:
+            positions: position of every card
+            ratings: overall rating of every card
+            prices: price of every card
+            formation: positions to fill
+            min_rating_total: minimum sum of ratings of selected cards
+            count_constraints: list of (bool array marking matching cards, minimum number of them)
+        """
+        self._positions = np.asarray(positions)
+        self._prices = np.asarray(prices, dtype=np.int64)
+        self._formation = formation
+        count_constraints = [(np.asarray(mask, dtype=bool), no_cards) for mask, no_cards in count_constraints
+                             if no_cards > 0]
+        # Totals above the required minimum are all equally good, so every dimension is capped
+        self._caps = (max(min_rating_total, 0),) + tuple(no_cards for _, no_cards in count_constraints)
+        # Contribution of every card to each capped total
+        self._card_deltas = np.column_stack(
+            [np.minimum(np.asarray(ratings, dtype=np.int64), self._caps[0])] +
+            [mask.astype(np.int64) for mask, _ in count_constraints]
+        )
+        self._card_masks = np.zeros(len(self._prices), dtype=np.int64)
+        for bit, (mask, _) in enumerate(count_constraints):
+            self._card_masks |= mask.astype(np.int64) << bit
+        self._ratings = np.asarray(ratings, dtype=np.int64)
+        self._frontiers = None
+
+    @staticmethod
+    def get_no_states(min_rating_total: int, count_constraints: List[Tuple[np.ndarray, int]]) -> int:
+        """Size of dynamic program state space for given constraints"""
+        no_states = max(min_rating_total, 0) + 1
+        for _, no_cards in count_constraints:
+            no_states *= max(no_cards, 0) + 1
+        return no_states
+
+    def get_no_state_updates(self) -> int:
+        """
+        Number of dynamic program state updates solve() performs, its running time is about proportional to it
+
+        Every outcome of every position frontier updates the whole state space once.
+        """
+        no_states = int(np.prod([cap + 1 for cap in self._caps]))
+        return no_states * sum(len(frontier) for _, frontier in self._get_frontiers())
+
+    def solve(self) -> List[int]:
+        """
+        Returns:
+            Indices of the cheapest cards fulfilling all constraints
+        """
+        shape = tuple(cap + 1 for cap in self._caps)
+        # best[s] is the cheapest cost of reaching totals of at least s
+        best = np.full(shape, np.inf)
+        best[(0,) * len(shape)] = 0
+        history = []
+
+        for position, frontier in self._get_frontiers():
+            if not frontier:
+                raise SolverExceptions.NoSolutionFound(f"Not enough cards for position {position}")
+
+            next_best = np.full(shape, np.inf)
+            for delta, (cost, _) in frontier.items():
+                np.minimum(next_best, self._shift(best, delta) + cost, out=next_best)
+            history.append((best, frontier))
+            best = next_best
+
+        state = self._caps
+        cost = best[state]
+        if not np.isfinite(cost):
+            raise SolverExceptions.NoSolutionFound("No solution found for given constraints")
+
+        selected_cards = []
+        for previous_best, frontier in reversed(history):
+            state, cost, cards = self._backtrack(previous_best, frontier, state, cost)
+            selected_cards.extend(cards)
+        return sorted(selected_cards)
+
+    def _get_frontiers(self) -> List[Tuple[str, dict]]:
+        """Frontier of every position of the formation, computed once"""
+        if self._frontiers is None:
+            self._frontiers = [
+                (position, self._get_position_frontier(np.flatnonzero(self._positions == position), no_slots))
+                for position, no_slots in Counter(str(pos) for pos in self._formation).items()
+            ]
+        return self._frontiers
+
+    def _get_position_frontier(self, card_indices: np.ndarray, no_slots: int) -> dict:
+        """Cheapest set of `no_slots` distinct cards for every reachable (rating total, counts) outcome"""
+        # layers[j] maps outcome of j chosen cards to (cost, cards)
+        layers = [{(0,) * len(self._caps): (0, ())}] + [{} for _ in range(no_slots)]
+        for card in self._prune_dominated(card_indices, no_slots):
+            card_delta = self._card_deltas[card]
+            card_price = int(self._prices[card])
+            for j in range(no_slots - 1, -1, -1):
+                for delta, (cost, cards) in list(layers[j].items()):
+                    next_delta = tuple(min(a + b, cap) for a, b, cap in zip(delta, card_delta, self._caps))
+                    current = layers[j + 1].get(next_delta)
+                    if current is None or cost + card_price < current[0]:
+                        layers[j + 1][next_delta] = (cost + card_price, cards + (card,))
+        return layers[no_slots]
+
+    def _prune_dominated(self, card_indices: np.ndarray, no_slots: int) -> np.ndarray:
+        """
+        Drop cards that can never be part of an optimal solution
+
+        A card is dominated by another one with rating not lower, matching at least the same
+        predicates and price not higher. Cards dominated `no_slots` times can always be swapped.
+        """
+        if len(card_indices) <= no_slots:
+            return card_indices
+
+        ratings = self._ratings[card_indices]
+        masks = self._card_masks[card_indices]
+        prices = self._prices[card_indices]
+        no_matches = np.array([bin(mask).count("1") for mask in masks])
+        # Cheapest first, better cards first on equal price, so dominating cards always come earlier
+        order = np.lexsort((-no_matches, -ratings, prices))
+        card_indices, ratings, masks, prices = card_indices[order], ratings[order], masks[order], prices[order]
+
+        # Only the `no_slots` cheapest cards of every (rating, predicates) type can be useful
+        _, type_ids = np.unique(np.column_stack((ratings, masks)), axis=0, return_inverse=True)
+        type_ids = type_ids.reshape(-1)
+        keep = np.zeros(len(card_indices), dtype=bool)
+        seen_per_type = Counter()
+        for i, type_id in enumerate(type_ids):
+            seen_per_type[type_id] += 1
+            keep[i] = seen_per_type[type_id] <= no_slots
+        card_indices, ratings, masks, prices = card_indices[keep], ratings[keep], masks[keep], prices[keep]
+
+        dominates = (
+            (ratings[:, None] >= ratings[None, :]) &
+            ((masks[:, None] & masks[None, :]) == masks[None, :]) &
+            (prices[:, None] <= prices[None, :])
+        )
+        # Identical cards dominate each other, only the earlier one counts
+        dominates = np.triu(dominates, k=1)
+        return card_indices[dominates.sum(axis=0) < no_slots]
+
+    def _shift(self, values: np.ndarray, delta) -> np.ndarray:
+        """Costs of reaching at least s once delta is added, i.e. values[max(s - delta, 0)]"""
+        for axis, shift in enumerate(delta):
+            if shift == 0:
+                continue
+            indices = np.maximum(np.arange(values.shape[axis]) - shift, 0)
+            values = np.take(values, indices, axis=axis)
+        return values
+
+    def _backtrack(self, previous_best: np.ndarray, frontier: dict, state: tuple, cost: float):
+        for delta, (delta_cost, cards) in frontier.items():
+            previous_state = tuple(max(target - shift, 0) for target, shift in zip(state, delta))
+            if previous_best[previous_state] + delta_cost == cost:
+                return previous_state, previous_best[previous_state], cards
+        raise RuntimeError("Decomposition backtracking failed")
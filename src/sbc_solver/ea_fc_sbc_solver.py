@@ -1,36 +1,41 @@
 from ortools.sat.python import cp_model
-from enum import Enum
 import src.sbc_solver.exceptions as SolverExceptions
+from src.data.card_normalization import normalize_version
+from src.data.csv_headers import CsvHeaders
+from src.sbc_solver.card_index import CardIndex
+from src.sbc_solver.decomposition_solver import DecompositionSolver
+import math
+import numpy as np
 import time
-import pandas as pd
 
+from collections import Counter
 from typing import List
 
 
-class CsvHeaders(Enum):
-    ID = "ID"
-    Name = "Name"
-    Position = "Position"
-    OverallRating = "OverallRating"
-    Version = "Version"
-    Price = "Price"
-    League = "League"
-    Nationality = "Nationality"
-    Club = "Club"
-    Futwiz = "Futwiz"
-    
-    def __str__(self):
-        return self.value
-
-
 class EaFcSbcSolver:
     _MAX_PLAYERS_IN_FORMATION = 11
+    # Constraints on squad level aggregates only, solvable position by position
+    _SEPARABLE_CONSTRAINT_KINDS = {
+        "min_cards_with_club", "min_cards_with_nation", "min_cards_with_league", "min_cards_with_version",
+        "min_rare_cards", "min_cards_with_overall", "min_overall_of_squad",
+    }
+    # The decomposition solver keeps one array of this many states per position
+    _MAX_DECOMPOSITION_STATES = 2000000
+    # Estimated solve times, calibrated with benchmarks/decomposition_benchmark.py
+    _DECOMPOSITION_SECONDS_PER_STATE_UPDATE = 1.2e-9
+    _CP_SAT_SECONDS_PER_CARD = 4e-5
 
     def __init__(self, ea_fc_cards_df, formation: List[str], max_time_for_solution_s=30):
-        self._model = cp_model.CpModel()
+        """
+        Args:
+            ea_fc_cards_df: DataFrame of cards, or a CardIndex shared by several solvers
+            formation: positions to fill
+            max_time_for_solution_s: CP-SAT time limit
+        """
         self._solver = cp_model.CpSolver()
         self._solver.parameters.num_workers = 8
         self._solver.parameters.max_time_in_seconds = max_time_for_solution_s
+        self._max_time_for_solution_s = max_time_for_solution_s
 
         if len(formation) > self._MAX_PLAYERS_IN_FORMATION:
             raise SolverExceptions.IncorrectFormation(
@@ -40,248 +45,385 @@ class EaFcSbcSolver:
         # Convert enum values to strings for pandas indexing
         position_header = str(CsvHeaders.Position)
         position_values = [str(pos) for pos in self._formation]
-        self._ea_fc_cards_df = ea_fc_cards_df[ea_fc_cards_df[position_header].isin(position_values)]
-        self._no_cards = len(self._ea_fc_cards_df)
-        id_header = str(CsvHeaders.ID)
-        self._cards_bools_vars = [self._model.NewBoolVar(f'{self._ea_fc_cards_df[id_header].iloc[i]}') for i in
-                                  range(self._no_cards)]
+        if isinstance(ea_fc_cards_df, CardIndex):
+            self._cards = ea_fc_cards_df.for_positions(position_values)
+        else:
+            self._cards = CardIndex(
+                ea_fc_cards_df[ea_fc_cards_df[position_header].astype(str).isin(position_values)])
+        self._ea_fc_cards_df = self._cards.cards_df
+        self._no_cards = len(self._cards)
+        # CP-SAT model is only built once a solve needs it, see _get_model
+        self._model = None
+        self._cards_bools_vars = None
+        self._player_chemistry = None
         self._leagues_bools = []
         self._nationality_bools = []
+        # Functions adding the constraints set so far to the CP-SAT model
+        self._cp_sat_constraints = []
         self._solved = False
-        self._player_chemistry = [self._model.NewIntVar(0, 3, f"player_{i}_chemistry") for i in range(self._no_cards)]
-
-        # Formation constraint
-        self._add_constraint_to_formation()
+        # Kinds of constraints set so far, identify the spec class for portfolio solving
+        self._constraint_kinds = set()
+        # Separable constraints as (cards matching mask, min number of them), used by decomposition
+        self._separable_count_constraints = []
+        self._min_overall_of_squad = 0
+        self._last_solve_stats = None
 
     def set_min_cards_with_club(self, club: str, no_players):
-        club_header = str(CsvHeaders.Club)
-        club_arr = self._ea_fc_cards_df[club_header].unique()
-        club_map_to_unique_id = self._get_map_attribute_to_number(club_arr)
-        if not club_map_to_unique_id.get(club):
+        self._constraint_kinds.add("min_cards_with_club")
+        club_code = self._cards.get_club_code(club)
+        if club_code < 0:
             raise SolverExceptions.IncorrectClubName(f"Club name: {club} is not on the list")
-
-        self._model.add(
-            sum(
-                (1 if self._ea_fc_cards_df[club_header].iloc[i] == club else 0) * self._cards_bools_vars[i] for i in
-                range(self._no_cards)
-            ) >= no_players
-        )
+        self._add_min_cards_constraint(self._cards.club_codes == club_code, no_players)
 
     def set_min_cards_with_nation(self, nation: str, no_players):
-        nation_header = str(CsvHeaders.Nationality)
-        nation_arr = self._ea_fc_cards_df[nation_header].unique()
-        nation_map_to_unique_id = self._get_map_attribute_to_number(nation_arr)
-        if nation_map_to_unique_id.get(nation) is None:
+        self._constraint_kinds.add("min_cards_with_nation")
+        nation_code = self._cards.get_nation_code(nation)
+        if nation_code < 0:
             raise SolverExceptions.IncorrectNationName(f"Nation name: {nation} is not on the list")
-
-        self._model.add(
-            sum(
-                (1 if self._ea_fc_cards_df[nation_header].iloc[i] == nation else 0) * self._cards_bools_vars[i]
-                for i in range(self._no_cards)
-            ) >= no_players
-        )
+        self._add_min_cards_constraint(self._cards.nation_codes == nation_code, no_players)
 
     def set_min_cards_with_league(self, league: str, no_players):
-        league_header = str(CsvHeaders.League)
-        league_arr = self._ea_fc_cards_df[league_header].unique()
-        league_map_to_unique_id = self._get_map_attribute_to_number(league_arr)
-        if league_map_to_unique_id.get(league) is None:
+        self._constraint_kinds.add("min_cards_with_league")
+        league_code = self._cards.get_league_code(league)
+        if league_code < 0:
             raise SolverExceptions.IncorrectLeagueName(f"League name: {league} is not on the list")
-
-        self._model.add(
-            sum(
-                (1 if self._ea_fc_cards_df[league_header].iloc[i] == league else 0) * self._cards_bools_vars[i] for
-                i in range(self._no_cards)
-            ) >= no_players
-        )
+        self._add_min_cards_constraint(self._cards.league_codes == league_code, no_players)
 
     def set_min_cards_with_version(self, version: str, no_players):
-        version_header = str(CsvHeaders.Version)
-        version_arr = self._ea_fc_cards_df[version_header].unique()
-        version_map_to_unique_id = self._get_map_attribute_to_number(version_arr)
-        if version_map_to_unique_id.get(version) is None:
+        self._constraint_kinds.add("min_cards_with_version")
+        # Versions are normalized at load time, normalize the requested one the same way
+        version = normalize_version(version)
+        is_version = self._cards.versions == version
+        if not is_version.any():
             raise SolverExceptions.IncorrectVersion(f"Version: {version} is not on the list")
-
-        self._model.add(
-            sum(
-                (1 if self._ea_fc_cards_df[version_header].iloc[i].strip() == version else 0) *
-                self._cards_bools_vars[i] for
-                i in range(self._no_cards)
-            ) >= no_players
-        )
+        self._add_min_cards_constraint(is_version, no_players)
 
     def set_min_rare_cards(self, no_players):
-        version_header = str(CsvHeaders.Version)
-        self._model.add(
-            sum(
-                (1 if self._is_card_version_rare(self._ea_fc_cards_df[version_header].iloc[i].strip()) else 0) *
-                self._cards_bools_vars[i] for
-                i in range(self._no_cards)
-            ) >= no_players
-        )
+        self._constraint_kinds.add("min_rare_cards")
+        self._add_min_cards_constraint(self._cards.is_rare, no_players)
 
     def set_min_cards_with_overall(self, no_players, overall):
-        rating_header = str(CsvHeaders.OverallRating)
-        self._model.add(
-            sum(
-                (1 if self._ea_fc_cards_df[rating_header].iloc[i] == overall else 0) *
-                self._cards_bools_vars[i] for
-                i in range(self._no_cards)
-            ) >= no_players
-        )
+        self._constraint_kinds.add("min_cards_with_overall")
+        self._add_min_cards_constraint(self._cards.ratings == overall, no_players)
 
     def set_max_leagues_for_solution(self, max_leagues):
-        league_header = str(CsvHeaders.League)
-        leagues_arr = self._ea_fc_cards_df[league_header].unique()
-        league_map_to_unique_id = self._get_map_attribute_to_number(leagues_arr)
-
-        league_vars = [self._model.NewIntVar(0, len(leagues_arr) - 1, f"League_{i}") for i in range(max_leagues)]
-
-        for i in range(self._no_cards):
-            is_league = [self._model.NewBoolVar(f'Is_League_{i}') for i in range(max_leagues)]
-            for j in range(max_leagues):
-                self._model.add(league_vars[j] == league_map_to_unique_id[
-                    self._ea_fc_cards_df[league_header].iloc[i]]).OnlyEnforceIf(is_league[j])
-            self._model.AddBoolOr(is_league).OnlyEnforceIf(self._cards_bools_vars[i])
+        self._constraint_kinds.add("max_leagues_for_solution")
+        self._add_cp_sat_constraint(lambda: self._add_max_values_constraint(
+            self._cards.league_codes, len(self._cards.leagues), max_leagues, "League"))
 
     def set_max_nations_for_solution(self, max_nations):
-        nation_header = str(CsvHeaders.Nationality)
-        nation_arr = self._ea_fc_cards_df[nation_header].unique()
-        nation_map_to_unique_id = self._get_map_attribute_to_number(nation_arr)
-
-        nation_vars = [self._model.NewIntVar(0, len(nation_arr) - 1, f"Nation_{i}") for i in range(max_nations)]
-
-        for i in range(self._no_cards):
-            is_nation = [self._model.NewBoolVar(f'Is_Nation_{i}') for i in range(max_nations)]
-            for j in range(max_nations):
-                self._model.add(nation_vars[j] == nation_map_to_unique_id[
-                    self._ea_fc_cards_df[nation_header].iloc[i]]).OnlyEnforceIf(is_nation[j])
-            self._model.AddBoolOr(is_nation).OnlyEnforceIf(self._cards_bools_vars[i])
+        self._constraint_kinds.add("max_nations_for_solution")
+        self._add_cp_sat_constraint(lambda: self._add_max_values_constraint(
+            self._cards.nation_codes, len(self._cards.nations), max_nations, "Nation"))
 
     def set_min_unique_leagues(self, no_leagues):
-        if not self._leagues_bools:
-            self._init_unique_leagues()
-
-        self._model.add(sum(self._leagues_bools) >= no_leagues)
+        self._constraint_kinds.add("min_unique_leagues")
+        self._add_cp_sat_constraint(lambda: self._model.add(sum(self._get_leagues_bools()) >= no_leagues))
 
     def set_max_unique_leagues(self, no_leagues):
-        if not self._leagues_bools:
-            self._init_unique_leagues()
-
-        self._model.add(sum(self._leagues_bools) <= no_leagues)
+        self._constraint_kinds.add("max_unique_leagues")
+        self._add_cp_sat_constraint(lambda: self._model.add(sum(self._get_leagues_bools()) <= no_leagues))
 
     def set_min_unique_nations(self, no_nations):
-        if not self._nationality_bools:
-            self._init_unique_nations()
-
-        self._model.add(sum(self._nationality_bools) >= no_nations)
+        self._constraint_kinds.add("min_unique_nations")
+        self._add_cp_sat_constraint(lambda: self._model.add(sum(self._get_nationality_bools()) >= no_nations))
 
     def set_exact_unique_nations(self, no_nations):
-        if not self._nationality_bools:
-            self._init_unique_nations()
-
-        self._model.add(sum(self._nationality_bools) == no_nations)
+        self._constraint_kinds.add("exact_unique_nations")
+        self._add_cp_sat_constraint(lambda: self._model.add(sum(self._get_nationality_bools()) == no_nations))
 
     def set_max_unique_nations(self, no_nations):
-        if not self._nationality_bools:
-            self._init_unique_nations()
-
-        self._model.add(sum(self._nationality_bools) <= no_nations)
+        self._constraint_kinds.add("max_unique_nations")
+        self._add_cp_sat_constraint(lambda: self._model.add(sum(self._get_nationality_bools()) <= no_nations))
 
     def set_min_team_chemistry(self, min_chemistry):
-        self._model.add(sum(self._player_chemistry) >= min_chemistry)
+        self._constraint_kinds.add("min_team_chemistry")
+        self._add_cp_sat_constraint(lambda: self._model.add(sum(self._get_player_chemistry()) >= min_chemistry))
 
     def set_min_overall_of_squad(self, min_overall):
-        rating_header = str(CsvHeaders.OverallRating)
-        self._model.add(
-            sum(
-                self._ea_fc_cards_df[rating_header].iloc[i] * self._cards_bools_vars[i] for i in
-                range(self._no_cards)
-            ) >= min_overall * self._no_players
-        )
+        self._constraint_kinds.add("min_overall_of_squad")
+        self._min_overall_of_squad = max(self._min_overall_of_squad, min_overall)
+        self._add_cp_sat_constraint(
+            lambda: self._model.add(self._get_squad_rating_sum() >= min_overall * self._no_players))
+
+    def _add_min_cards_constraint(self, is_matching: np.ndarray, no_players):
+        self._separable_count_constraints.append((is_matching, no_players))
+        self._add_cp_sat_constraint(lambda: self._model.add(
+            cp_model.LinearExpr.sum([self._cards_bools_vars[i] for i in np.flatnonzero(is_matching)]) >= no_players))
+
+    def _add_cp_sat_constraint(self, add_constraint):
+        """Add constraint to the CP-SAT model now if it is built, or else once it is"""
+        self._cp_sat_constraints.append(add_constraint)
+        if self._model is not None:
+            add_constraint()
+
+    def _get_model(self) -> cp_model.CpModel:
+        """CP-SAT model with all constraints set so far, built on first use"""
+        if self._model is None:
+            self._model = cp_model.CpModel()
+            self._cards_bools_vars = [self._model.NewBoolVar(str(card_id)) for card_id in self._cards.ids]
+            # Formation constraint
+            self._add_constraint_to_formation()
+            for add_constraint in self._cp_sat_constraints:
+                add_constraint()
+        return self._model
 
     def _add_constraint_to_formation(self):
-        position_header = str(CsvHeaders.Position)
         # Each position in formation must be filled exactly once
         position_count = {}
         for pos in self._formation:
             position_count[str(pos)] = position_count.get(str(pos), 0) + 1
 
         for position, count in position_count.items():
-            self._model.add(
-                sum(
-                    (1 if self._ea_fc_cards_df[position_header].iloc[i] == position else 0) *
-                    self._cards_bools_vars[i] for i in range(self._no_cards)
-                ) == count
-            )
+            self._model.add(cp_model.LinearExpr.sum(
+                [self._cards_bools_vars[i] for i in np.flatnonzero(self._cards.positions == position)]) == count)
 
         # Total players constraint
-        self._model.add(sum(self._cards_bools_vars) == self._no_players)
-
-    def _get_map_attribute_to_number(self, attribute_arr):
-        return {attr: i for i, attr in enumerate(attribute_arr)}
-
-    def _is_card_version_rare(self, version):
-        rare_versions = ["TOTW", "TOTS", "TOTY", "ICON", "HERO", "CB", "SBC", "PINK", "TEAL", "PURPLE", "BLUE", "UNKNOWN"]
-        return any(rare in version.upper() for rare in rare_versions)
-
-    def _init_unique_leagues(self):
-        league_header = str(CsvHeaders.League)
-        leagues_arr = self._ea_fc_cards_df[league_header].unique()
-        league_map_to_unique_id = self._get_map_attribute_to_number(leagues_arr)
-        self._leagues_bools = [self._model.NewBoolVar(f'league_{i}') for i in range(len(leagues_arr))]
-
-        for i, league in enumerate(leagues_arr):
-            league_cards = [
-                self._cards_bools_vars[j] for j in range(self._no_cards)
-                if self._ea_fc_cards_df[league_header].iloc[j] == league
-            ]
-            if league_cards:
-                # If any card of this league is selected, league_bool should be true
-                self._model.add(sum(league_cards) > 0).OnlyEnforceIf(self._leagues_bools[i])
-                self._model.add(sum(league_cards) == 0).OnlyEnforceIf(self._leagues_bools[i].Not())
-
-    def _init_unique_nations(self):
-        nation_header = str(CsvHeaders.Nationality)
-        nation_arr = self._ea_fc_cards_df[nation_header].unique()
-        nation_map_to_unique_id = self._get_map_attribute_to_number(nation_arr)
-        self._nationality_bools = [self._model.NewBoolVar(f'nation_{i}') for i in range(len(nation_arr))]
-
-        for i, nation in enumerate(nation_arr):
-            nation_cards = [
-                self._cards_bools_vars[j] for j in range(self._no_cards)
-                if self._ea_fc_cards_df[nation_header].iloc[j] == nation
-            ]
-            if nation_cards:
-                # If any card of this nation is selected, nationality_bool should be true
-                self._model.add(sum(nation_cards) > 0).OnlyEnforceIf(self._nationality_bools[i])
-                self._model.add(sum(nation_cards) == 0).OnlyEnforceIf(self._nationality_bools[i].Not())
-
-    def solve(self):
+        self._model.add(cp_model.LinearExpr.sum(self._cards_bools_vars) == self._no_players)
+
+    def _add_max_values_constraint(self, codes: np.ndarray, no_values: int, max_values: int, name: str):
+        # Every selected card must take one of `max_values` attribute values
+        value_vars = [self._model.NewIntVar(0, no_values - 1, f"{name}_{i}") for i in range(max_values)]
+
+        for i in range(self._no_cards):
+            is_value = [self._model.NewBoolVar(f'Is_{name}_{i}') for i in range(max_values)]
+            for j in range(max_values):
+                self._model.add(value_vars[j] == int(codes[i])).OnlyEnforceIf(is_value[j])
+            self._model.AddBoolOr(is_value).OnlyEnforceIf(self._cards_bools_vars[i])
+
+    def _get_leagues_bools(self):
+        if not self._leagues_bools:
+            self._leagues_bools = self._get_value_bools(self._cards.league_codes, len(self._cards.leagues), "league")
+        return self._leagues_bools
+
+    def _get_nationality_bools(self):
+        if not self._nationality_bools:
+            self._nationality_bools = self._get_value_bools(self._cards.nation_codes, len(self._cards.nations),
+                                                            "nation")
+        return self._nationality_bools
+
+    def _get_value_bools(self, codes: np.ndarray, no_values: int, name: str):
+        """One bool per attribute value, true if and only if any selected card has that value"""
+        value_bools = [self._model.NewBoolVar(f'{name}_{i}') for i in range(no_values)]
+        # Cards grouped by value
+        order = np.argsort(codes, kind="stable")
+        groups = np.split(order, np.cumsum(np.bincount(codes, minlength=no_values))[:-1])
+
+        for value_bool, group in zip(value_bools, groups):
+            value_cards = cp_model.LinearExpr.sum([self._cards_bools_vars[j] for j in group])
+            # If any card of this value is selected, value_bool should be true
+            self._model.add(value_cards > 0).OnlyEnforceIf(value_bool)
+            self._model.add(value_cards == 0).OnlyEnforceIf(value_bool.Not())
+        return value_bools
+
+    def _get_player_chemistry(self):
+        if self._player_chemistry is None:
+            self._player_chemistry = [self._model.NewIntVar(0, 3, f"player_{i}_chemistry")
+                                      for i in range(self._no_cards)]
+        return self._player_chemistry
+
+    def _get_squad_rating_sum(self):
+        return cp_model.LinearExpr.weighted_sum(self._cards_bools_vars, self._cards.ratings.tolist())
+
+    def solve(self, portfolio=None, use_decomposition=True):
+        """
+        Find the cheapest set of cards fulfilling all constraints
+
+        SBCs with only squad level aggregate constraints are solved exactly by the decomposition
+        solver when its estimated solve time is lower than that of CP-SAT, everything else by CP-SAT.
+
+        Args:
+            portfolio: optional SolverPortfolio racing several solver configurations,
+                by default a single solver with default parameters is used
+            use_decomposition: allow the decomposition solver for separable SBCs
+        """
+        if use_decomposition and self._is_position_separable():
+            start_time = time.time()
+            decomposition_solver = self._create_decomposition_solver()
+            if self._is_decomposition_faster(decomposition_solver):
+                return self._solve_with_decomposition(decomposition_solver, start_time)
+
+        model = self._get_model()
         # Objective: minimize total price
-        price_header = str(CsvHeaders.Price)
-        self._model.minimize(
-            sum(
-                self._ea_fc_cards_df[price_header].iloc[i] * self._cards_bools_vars[i] for i in range(self._no_cards)
-            )
-        )
+        self._set_price_objective()
 
         print(f"Solving with {self._no_cards} cards and {self._no_players} positions")
         
         start_time = time.time()
-        status = self._solver.Solve(self._model)
+        if portfolio is None:
+            status = self._solver.Solve(model)
+        else:
+            self._solver, status, _ = portfolio.solve(model, self._get_spec_class(), self._max_time_for_solution_s)
         end_time = time.time()
+        self._update_cp_sat_stats(status)
 
         print(f"Solver status: {status}")
         print(f"Solver time: {end_time - start_time}s")
 
         if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
             self._solved = True
-            solution_cards = []
-            for i in range(self._no_cards):
-                if self._solver.Value(self._cards_bools_vars[i]):
-                    solution_cards.append(self._ea_fc_cards_df.iloc[i])
+            solution_cards = self._get_solution_cards()
             print(f"SBC solved in: {end_time - start_time}s")
             return solution_cards
         else:
-            raise SolverExceptions.NoSolutionFound("No solution found for given constraints")
\ No newline at end of file
+            raise SolverExceptions.NoSolutionFound("No solution found for given constraints")
+
+    def get_solve_stats(self):
+        """Statistics of the last solve, None if not solved yet"""
+        return self._last_solve_stats
+
+    def sweep_min_overall_of_squad(self, min_overalls):
+        """
+        Solve the SBC for several squad overall ratings reusing one model
+
+        The cheapest price never decreases as the rating rises, so ratings are visited in
+        descending order. The cheapest squad found for one rating is feasible for all lower
+        ones and bounds their price, so every card that can only be part of pricier squads
+        is excluded before solving them. Levels are solved on copies of the model, afterwards
+        the highest feasible rating stays set like set_min_overall_of_squad.
+
+        Args:
+            min_overalls: iterable of minimum squad overall ratings to evaluate
+
+        Returns:
+            List of Pareto optimal points (price vs squad rating), cheapest first.
+            Each point is a dict with keys "min_overall", "price", "squad_rating"
+            and "cards".
+        """
+        model = self._get_model()
+        self._set_price_objective()
+        squad_rating_sum = self._get_squad_rating_sum()
+        min_squad_prices = self._get_min_squad_prices()
+
+        points = []
+        max_price = None
+        for min_overall in sorted(set(min_overalls), reverse=True):
+            level_model = model.clone()
+            level_model.add(squad_rating_sum >= min_overall * self._no_players)
+            if max_price is not None:
+                for i in np.flatnonzero(min_squad_prices > max_price):
+                    level_model.add(self._cards_bools_vars[i] == 0)
+
+            start_time = time.time()
+            status = self._solver.Solve(level_model)
+            end_time = time.time()
+            self._update_cp_sat_stats(status)
+            print(f"Squad overall {min_overall}: status {status}, time {end_time - start_time}s")
+
+            if status != cp_model.OPTIMAL and status != cp_model.FEASIBLE:
+                continue
+
+            self._solved = True
+            cards = self._get_solution_cards()
+            max_price = int(self._solver.ObjectiveValue())
+            points.append({
+                "min_overall": min_overall,
+                "price": max_price,
+                "squad_rating": sum(int(card[str(CsvHeaders.OverallRating)]) for card in cards) / self._no_players,
+                "cards": cards,
+            })
+
+        if not points:
+            raise SolverExceptions.NoSolutionFound("No solution found for given constraints")
+
+        frontier = []
+        for point in reversed(points):
+            # Same price for a higher rating dominates the previous point
+            if frontier and frontier[-1]["price"] >= point["price"]:
+                frontier[-1] = point
+            else:
+                frontier.append(point)
+
+        self.set_min_overall_of_squad(points[0]["min_overall"])
+        return frontier
+
+    def _get_min_squad_prices(self) -> np.ndarray:
+        """Lower bound on the price of any squad including each card, from the formation alone"""
+        min_squad_price = 0
+        # Price of the most expensive card in the cheapest filling of each card's position
+        replaced_prices = np.zeros(self._no_cards, dtype=np.int64)
+        for position, no_slots in Counter(str(pos) for pos in self._formation).items():
+            is_position = self._cards.positions == position
+            cheapest_prices = np.sort(self._cards.prices[is_position])[:no_slots]
+            if len(cheapest_prices) < no_slots:
+                # Formation can't be filled, nothing to exclude
+                return np.zeros(self._no_cards, dtype=np.int64)
+            min_squad_price += int(cheapest_prices.sum())
+            replaced_prices[is_position] = cheapest_prices[-1]
+        return min_squad_price - replaced_prices + self._cards.prices
+
+    def _is_position_separable(self):
+        if not self._constraint_kinds <= self._SEPARABLE_CONSTRAINT_KINDS:
+            return False
+        no_states = DecompositionSolver.get_no_states(self._min_overall_of_squad * self._no_players,
+                                                      self._separable_count_constraints)
+        return no_states <= self._MAX_DECOMPOSITION_STATES
+
+    def _create_decomposition_solver(self):
+        return DecompositionSolver(
+            self._cards.positions,
+            self._cards.ratings,
+            self._cards.prices,
+            self._formation,
+            self._min_overall_of_squad * self._no_players,
+            self._separable_count_constraints,
+        )
+
+    def _is_decomposition_faster(self, decomposition_solver):
+        # The dynamic program grows with constraint bounds, CP-SAT with the card pool
+        decomposition_time = decomposition_solver.get_no_state_updates() * self._DECOMPOSITION_SECONDS_PER_STATE_UPDATE
+        return decomposition_time <= self._no_cards * self._CP_SAT_SECONDS_PER_CARD
+
+    def _solve_with_decomposition(self, decomposition_solver, start_time):
+        print(f"Solving with {self._no_cards} cards and {self._no_players} positions using decomposition")
+
+        try:
+            card_indices = decomposition_solver.solve()
+        except SolverExceptions.NoSolutionFound:
+            self._update_decomposition_stats("INFEASIBLE", time.time() - start_time, None)
+            raise
+        end_time = time.time()
+
+        self._solved = True
+        solution_cards = [self._ea_fc_cards_df.iloc[i] for i in card_indices]
+        total_price = int(sum(card[str(CsvHeaders.Price)] for card in solution_cards))
+        self._update_decomposition_stats("OPTIMAL", end_time - start_time, total_price)
+        print(f"SBC solved in: {end_time - start_time}s")
+        return solution_cards
+
+    def _update_decomposition_stats(self, status, wall_time_s, total_price):
+        self._last_solve_stats = {
+            "engine": "decomposition",
+            "status": status,
+            "wall_time_s": wall_time_s,
+            "objective": total_price,
+            "best_bound": total_price,
+            "no_cards": self._no_cards,
+        }
+
+    def _update_cp_sat_stats(self, status):
+        solved = status == cp_model.OPTIMAL or status == cp_model.FEASIBLE
+        self._last_solve_stats = {
+            "engine": "cp_sat",
+            "status": self._solver.StatusName(status),
+            "wall_time_s": self._solver.WallTime(),
+            "objective": self._solver.ObjectiveValue() if solved else None,
+            "best_bound": self._solver.BestObjectiveBound() if solved else None,
+            "no_cards": self._no_cards,
+        }
+
+    def _get_spec_class(self):
+        # Similar SBCs share constraint kinds, squad size and order of magnitude of the card pool
+        cards_magnitude = 10 ** int(math.log10(self._no_cards)) if self._no_cards else 0
+        constraint_kinds = "+".join(sorted(self._constraint_kinds)) or "no_constraints"
+        return f"{self._no_players}_players|{constraint_kinds}|{cards_magnitude}_cards"
+
+    def _set_price_objective(self):
+        self._model.minimize(cp_model.LinearExpr.weighted_sum(self._cards_bools_vars, self._cards.prices.tolist()))
+
+    def _get_solution_cards(self):
+        solution_cards = []
+        for i in range(self._no_cards):
+            if self._solver.Value(self._cards_bools_vars[i]):
+                solution_cards.append(self._ea_fc_cards_df.iloc[i])
+        return solution_cards
@@ -28,6 +28,16 @@ class IncorrectVersion(SbcSolverException):
     pass
 
 
+class IncorrectSpec(SbcSolverException):
+    """Exception raised when a solve request spec is malformed"""
+    pass
+
+
+class IncorrectConstraint(IncorrectSpec):
+    """Exception raised when constraint name or arguments are incorrect"""
+    pass
+
+
 class NoSolutionFound(SbcSolverException):
     """Exception raised when no solution is found for given constraints"""
     pass
\ No newline at end of file
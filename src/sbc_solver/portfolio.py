@@ -0,0 +1,156 @@
+from ortools.sat.python import cp_model
+import json
+import os
+import queue
+import statistics
+import threading
+import time
+
+from typing import Dict, Optional
+
+
+class SolverPortfolio:
+    """
+    Races several CP-SAT parameter sets on the same model
+
+    The first configuration that proves optimality (or infeasibility) wins, the others are
+    stopped. Wins and solve times of the winners are recorded per spec class. Once a spec
+    class has `min_races_to_learn` recorded solve times, the configuration with the lowest
+    mean solve time is applied directly instead of racing, with a race every `race_every`
+    solves to keep the statistics fresh. Direct solves are timed as well, so a configuration
+    that wins races but is slow on its own loses to the next race winner.
+    """
+
+    # Solve times kept per configuration and spec class, older ones are dropped
+    _MAX_SOLVE_TIMES = 20
+
+    DEFAULT_CONFIGURATIONS = {
+        "default_8_workers": {"num_workers": 8},
+        "fixed_search_1_worker": {
+            "num_workers": 1,
+            "search_branching": cp_model.FIXED_SEARCH,
+        },
+        "linearization_2_4_workers": {"num_workers": 4, "linearization_level": 2},
+        "no_presolve_4_workers": {"num_workers": 4, "cp_model_presolve": False},
+    }
+
+    def __init__(self, configurations: Optional[Dict[str, dict]] = None, stats_file: Optional[str] = None,
+                 min_races_to_learn: int = 3, race_every: int = 10):
+        self.configurations = configurations if configurations is not None else self.DEFAULT_CONFIGURATIONS
+        self.stats_file = stats_file
+        self.min_races_to_learn = min_races_to_learn
+        self.race_every = race_every
+        # {spec_class: {"solves": n, "wins": {configuration_name: n},
+        #               "solve_times": {configuration_name: [seconds, ...]}}}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+        if stats_file and os.path.exists(stats_file):
+            with open(stats_file, 'r') as f:
+                self._stats = json.load(f)
+
+    def solve(self, model: cp_model.CpModel, spec_class: str, max_time_for_solution_s: float):
+        """
+        Solve the model with the learned configuration for its spec class, or race all of them
+
+        Returns:
+            Tuple (solver, status, configuration name) of the winning configuration
+        """
+        with self._lock:
+            class_stats = self._stats.setdefault(spec_class, {"solves": 0, "wins": {}})
+            class_stats["solves"] += 1
+            learned_configuration = self.get_learned_configuration(spec_class)
+            race = learned_configuration is None or class_stats["solves"] % self.race_every == 0
+
+        if not race:
+            solver = self._create_solver(learned_configuration, max_time_for_solution_s)
+            start_time = time.time()
+            status = solver.Solve(model)
+            # Solves hitting the time limit are recorded too, they were slow as well
+            self._record_solve(spec_class, learned_configuration, time.time() - start_time)
+            return solver, status, learned_configuration
+
+        solver, status, configuration_name, solve_time = self._race(model, max_time_for_solution_s)
+        if status == cp_model.OPTIMAL or status == cp_model.INFEASIBLE:
+            self._record_solve(spec_class, configuration_name, solve_time, win=True)
+        return solver, status, configuration_name
+
+    def get_learned_configuration(self, spec_class: str) -> Optional[str]:
+        """
+        Name of the configuration with the lowest mean solve time for spec class,
+        None if not enough solves have been timed yet
+        """
+        solve_times = self._stats.get(spec_class, {}).get("solve_times", {})
+        solve_times = {name: times for name, times in solve_times.items() if name in self.configurations and times}
+        if sum(len(times) for times in solve_times.values()) < self.min_races_to_learn:
+            return None
+        return min(solve_times, key=lambda name: statistics.mean(solve_times[name]))
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return json.loads(json.dumps(self._stats))
+
+    def _race(self, model: cp_model.CpModel, max_time_for_solution_s: float):
+        solvers = {name: self._create_solver(name, max_time_for_solution_s) for name in self.configurations}
+        results = queue.Queue()
+
+        def run(name, solver):
+            start_time = time.time()
+            status = solver.Solve(model)
+            results.put((name, solver, status, time.time() - start_time))
+
+        threads = [threading.Thread(target=run, args=(name, solver), daemon=True) for name, solver in solvers.items()]
+        for thread in threads:
+            thread.start()
+
+        finished = []
+        winner = None
+        for _ in range(len(threads)):
+            name, solver, status, solve_time = results.get()
+            finished.append((name, solver, status, solve_time))
+            if status == cp_model.OPTIMAL or status == cp_model.INFEASIBLE:
+                print(f"Portfolio winner: {name} ({solver.StatusName(status)} in {solve_time:.3f}s)")
+                winner = (solver, status, name, solve_time)
+                break
+
+        # Cancel the rest of the race
+        for solver in solvers.values():
+            solver.StopSearch()
+        for thread in threads:
+            thread.join()
+
+        if winner is not None:
+            return winner
+
+        # Nobody proved optimality within the time limit, take the cheapest solution found
+        feasible = [result for result in finished if result[2] == cp_model.FEASIBLE]
+        if feasible:
+            name, solver, status, solve_time = min(feasible, key=lambda result: result[1].ObjectiveValue())
+            return solver, status, name, solve_time
+        name, solver, status, solve_time = finished[-1]
+        return solver, status, name, solve_time
+
+    def _create_solver(self, configuration_name: str, max_time_for_solution_s: float) -> cp_model.CpSolver:
+        solver = cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = max_time_for_solution_s
+        for parameter, value in self.configurations[configuration_name].items():
+            setattr(solver.parameters, parameter, value)
+        return solver
+
+    def _record_solve(self, spec_class: str, configuration_name: str, solve_time: float, win: bool = False):
+        with self._lock:
+            class_stats = self._stats[spec_class]
+            if win:
+                class_stats["wins"][configuration_name] = class_stats["wins"].get(configuration_name, 0) + 1
+            solve_times = class_stats.setdefault("solve_times", {}).setdefault(configuration_name, [])
+            solve_times.append(solve_time)
+            del solve_times[:-self._MAX_SOLVE_TIMES]
+            if self.stats_file:
+                self._save_stats()
+
+    def _save_stats(self):
+        # Write to a temporary file first so a crash never leaves a corrupted file
+        tmp_file = self.stats_file + ".tmp"
+        with open(tmp_file, 'w') as f:
+            json.dump(self._stats, f, indent=2)
+        os.replace(tmp_file, self.stats_file)
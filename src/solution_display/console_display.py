@@ -1,20 +1,4 @@
-from enum import Enum
-
-
-class CsvHeaders(Enum):
-    ID = "ID"
-    Name = "Name"
-    Position = "Position"
-    OverallRating = "OverallRating"
-    Version = "Version"
-    Price = "Price"
-    League = "League"
-    Nationality = "Nationality"
-    Club = "Club"
-    Futwiz = "Futwiz"
-    
-    def __str__(self):
-        return self.value
+from src.data.csv_headers import CsvHeaders
 
 
 class SbcSolutionConsoleDisplay:
@@ -0,0 +1,205 @@
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import inspect
+import json
+import math
+import threading
+import time
+
+from src.data.fc26_data_provider import FC26DataProvider
+from src.sbc_solver.card_index import CardIndex
+from src.sbc_solver.ea_fc_sbc_solver import EaFcSbcSolver
+import src.sbc_solver.exceptions as SolverExceptions
+from src.utils.formations import Formations
+
+
+class SbcSolveService:
+    """
+    Solves SBC specs against a resident card store
+
+    Player data is loaded once per set of formation positions and kept in memory, together
+    with the attribute arrays constraints are built from.
+    Identical specs solved at the same time are coalesced into a single solve.
+
+    Spec format:
+        {
+            "formation": "4-4-2" or list of positions,
+            "constraints": [{"constraint": "min_overall_of_squad", "args": [84]}, ...],
+            "max_time_s": 30
+        }
+    Constraint names are EaFcSbcSolver.set_* method names without the "set_" prefix.
+    Malformed specs raise IncorrectSpec.
+    """
+
+    def __init__(self, provider: FC26DataProvider, source: str = "auto", portfolio=None):
+        self.provider = provider
+        self.source = source
+        self.portfolio = portfolio
+        # CardIndex of cards for formation positions, keyed by sorted positions
+        self._cards_by_positions = {}
+        self._data_lock = threading.Lock()
+        # Solves in progress, keyed by canonical spec
+        self._in_flight = {}
+        self._in_flight_lock = threading.Lock()
+
+    def solve(self, spec: dict) -> dict:
+        """Solve spec, or wait for an identical spec already being solved"""
+        key = json.dumps(spec, sort_keys=True)
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            coalesced = future is not None
+            if not coalesced:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not coalesced:
+            try:
+                future.set_result(self._solve(spec))
+            except Exception as e:
+                future.set_exception(e)
+            finally:
+                with self._in_flight_lock:
+                    del self._in_flight[key]
+
+        result = future.result()
+        return dict(result, metrics=dict(result["metrics"], coalesced=coalesced))
+
+    def _solve(self, spec: dict) -> dict:
+        start_time = time.time()
+        self._validate_spec(spec)
+        formation = self._get_formation(spec.get("formation"))
+        cards = self._get_cards(formation)
+
+        sbc_solver = EaFcSbcSolver(cards, formation, max_time_for_solution_s=spec.get("max_time_s", 30))
+        for constraint in spec.get("constraints", []):
+            self._add_constraint(sbc_solver, constraint)
+        build_time = time.time() - start_time
+
+        solution_cards = sbc_solver.solve(portfolio=self.portfolio)
+        solve_stats = sbc_solver.get_solve_stats()
+        cards = [card.to_dict() for card in solution_cards]
+        return {
+            "cards": cards,
+            "total_price": sum(int(card["Price"]) for card in cards),
+            "squad_rating": sum(int(card["OverallRating"]) for card in cards) / len(formation),
+            "metrics": {
+                "status": solve_stats["status"],
+                "no_cards": solve_stats["no_cards"],
+                "build_time_s": build_time,
+                "solve_time_s": solve_stats["wall_time_s"],
+                "total_time_s": time.time() - start_time,
+            },
+        }
+
+    def _validate_spec(self, spec: dict):
+        unknown_fields = set(spec) - {"formation", "constraints", "max_time_s"}
+        if unknown_fields:
+            raise SolverExceptions.IncorrectSpec(f"Unknown spec fields: {', '.join(sorted(unknown_fields))}")
+
+        formation = spec.get("formation")
+        is_position_list = isinstance(formation, list) and all(isinstance(position, str) for position in formation)
+        if not isinstance(formation, str) and not is_position_list:
+            raise SolverExceptions.IncorrectSpec("formation must be a formation name or a list of positions")
+
+        constraints = spec.get("constraints", [])
+        if not isinstance(constraints, list) or not all(isinstance(constraint, dict) for constraint in constraints):
+            raise SolverExceptions.IncorrectSpec("constraints must be a list of objects")
+
+        max_time_s = spec.get("max_time_s", 30)
+        # bool is an int subclass, but true isn't a time limit
+        if isinstance(max_time_s, bool) or not isinstance(max_time_s, (int, float)) or \
+                not math.isfinite(max_time_s) or max_time_s <= 0:
+            raise SolverExceptions.IncorrectSpec(f"max_time_s must be a positive number, got {max_time_s!r}")
+
+    def _get_formation(self, formation):
+        if isinstance(formation, list):
+            return [str(position) for position in formation]
+        try:
+            return Formations["F" + str(formation).replace("-", "_")].value
+        except KeyError:
+            raise SolverExceptions.IncorrectFormation(f"Unknown formation: {formation}")
+
+    def _get_cards(self, formation) -> CardIndex:
+        key = tuple(sorted(set(formation)))
+        with self._data_lock:
+            if key not in self._cards_by_positions:
+                self._cards_by_positions[key] = CardIndex(
+                    self.provider.get_players_data(source=self.source, positions=key))
+            return self._cards_by_positions[key]
+
+    def _add_constraint(self, sbc_solver: EaFcSbcSolver, constraint: dict):
+        name = constraint.get("constraint")
+        setter = getattr(sbc_solver, f"set_{name}", None)
+        if not name or setter is None:
+            raise SolverExceptions.IncorrectConstraint(f"Unknown constraint: {name}")
+        args = constraint.get("args", [])
+        if not isinstance(args, (list, dict)):
+            raise SolverExceptions.IncorrectConstraint(f"Arguments of constraint {name} must be a list or an object")
+        signature = inspect.signature(setter)
+        try:
+            bound_args = signature.bind(**args) if isinstance(args, dict) else signature.bind(*args)
+        except TypeError as e:
+            raise SolverExceptions.IncorrectConstraint(f"Invalid arguments for constraint {name}: {e}")
+
+        # Names are annotated as str, everything else is a number of cards or a rating
+        for arg_name, value in bound_args.arguments.items():
+            if signature.parameters[arg_name].annotation is str:
+                if not isinstance(value, str):
+                    raise SolverExceptions.IncorrectConstraint(f"Argument {arg_name} of {name} must be a string")
+            elif isinstance(value, bool) or not isinstance(value, int):
+                raise SolverExceptions.IncorrectConstraint(f"Argument {arg_name} of {name} must be an integer")
+        setter(*bound_args.args, **bound_args.kwargs)
+
+
+class _SolveRequestHandler(BaseHTTPRequestHandler):
+    # Keep-alive, clients can reuse one connection for many requests
+    protocol_version = "HTTP/1.1"
+    service: SbcSolveService = None
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        else:
+            self._send_json(404, {"error": f"Not found: {self.path}"})
+
+    def do_POST(self):
+        if self.path != "/solve":
+            self._send_json(404, {"error": f"Not found: {self.path}"})
+            return
+
+        try:
+            content_length = int(self.headers.get("Content-Length", 0))
+            spec = json.loads(self.rfile.read(content_length))
+            if not isinstance(spec, dict):
+                raise ValueError("Spec must be a JSON object")
+        except ValueError as e:
+            self._send_json(400, {"error": f"Invalid JSON spec: {e}"})
+            return
+
+        try:
+            self._send_json(200, self.service.solve(spec))
+        except SolverExceptions.IncorrectSpec as e:
+            self._send_json(400, {"error": str(e), "type": type(e).__name__})
+        except SolverExceptions.SbcSolverException as e:
+            self._send_json(422, {"error": str(e), "type": type(e).__name__})
+        except Exception as e:
+            self._send_json(500, {"error": str(e), "type": type(e).__name__})
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload: dict):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def create_server(service: SbcSolveService, host: str = "127.0.0.1", port: int = 8026) -> ThreadingHTTPServer:
+    """Create HTTP server exposing POST /solve and GET /health, call serve_forever() to run it"""
+    handler = type("SolveRequestHandler", (_SolveRequestHandler,), {"service": service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
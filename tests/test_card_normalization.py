@@ -0,0 +1,53 @@
+"""Version canonicalization and derived rarity columns"""
+import pandas as pd
+import pytest
+
+from src.data.card_normalization import normalize_cards, normalize_version
+
+
+def normalize_versions(versions):
+    return normalize_cards(pd.DataFrame({
+        "ID": range(len(versions)),
+        "OverallRating": 80,
+        "Version": versions,
+    })).set_index("ID")
+
+
+@pytest.mark.parametrize("version, expected", [
+    ("  team of  the week ", "TOTW"),
+    ("Team of the Season", "TOTS"),
+    ("TEAM OF THE YEAR", "TOTY"),
+    ("Squad Building Challenge", "SBC"),
+    ("FUT Heroes", "HERO"),
+    ("Icons", "ICON"),
+    ("Non-Rare Gold", "NON RARE GOLD"),
+    ("rare  gold", "RARE GOLD"),
+    ("TOTW", "TOTW"),
+])
+def test_version_is_canonical(version, expected):
+    assert normalize_version(version) == expected
+    assert normalize_versions([version]).loc[0, "Version"] == expected
+
+
+@pytest.mark.parametrize("version, tier", [
+    ("GOLD", "COMMON"),
+    ("Common", "COMMON"),
+    ("NON RARE SILVER", "COMMON"),
+    (None, "COMMON"),
+    ("Rare", "RARE"),
+    ("RARE BRONZE", "RARE"),
+    ("Team of the Week", "SPECIAL"),
+    ("ICON", "SPECIAL"),
+    ("FUTURE STARS", "SPECIAL"),
+])
+def test_rarity_follows_from_version(version, tier):
+    card = normalize_versions([version]).loc[0]
+
+    assert card["Tier"] == tier
+    assert card["IsRare"] == (tier != "COMMON")
+    assert card["IsSpecial"] == (tier == "SPECIAL")
+
+
+def test_normalized_cards_are_returned_as_they_are():
+    cards_df = normalize_versions(["Team of the Week", "GOLD"])
+    assert normalize_cards(cards_df) is cards_df
@@ -0,0 +1,104 @@
+"""EaFcSbcSolver against separately built solvers on synthetic card pools"""
+import random
+import time
+
+import pytest
+
+from benchmarks.decomposition_benchmark import generate_cards
+from src.sbc_solver.ea_fc_sbc_solver import EaFcSbcSolver
+from src.sbc_solver.exceptions import NoSolutionFound
+from src.utils.formations import Formations
+
+FORMATION = Formations.F4_4_2.value
+# Every separable constraint kind with a generator of random arguments for a card pool
+SEPARABLE_CONSTRAINTS = {
+    "min_overall_of_squad": lambda rng, cards_df: (rng.randint(75, 88),),
+    "min_rare_cards": lambda rng, cards_df: (rng.randint(1, 8),),
+    "min_cards_with_overall": lambda rng, cards_df: (rng.randint(1, 4), rng.randint(80, 90)),
+    "min_cards_with_version": lambda rng, cards_df: (rng.choice(["GOLD", "RARE GOLD", "TOTW"]), rng.randint(1, 4)),
+    "min_cards_with_nation": lambda rng, cards_df: (pick_value(rng, cards_df, "Nationality"), rng.randint(1, 2)),
+    "min_cards_with_league": lambda rng, cards_df: (pick_value(rng, cards_df, "League"), rng.randint(1, 3)),
+    "min_cards_with_club": lambda rng, cards_df: (pick_value(rng, cards_df, "Club"), 1),
+}
+
+
+@pytest.fixture(scope="module")
+def cards_df():
+    return generate_cards(1000)
+
+
+def pick_value(rng, cards_df, column):
+    return rng.choice(sorted(cards_df[column].unique()))
+
+
+def get_price(cards):
+    return sum(int(card["Price"]) for card in cards)
+
+
+def solve_min_overall(cards_df, min_overall):
+    sbc_solver = EaFcSbcSolver(cards_df, FORMATION)
+    sbc_solver.set_min_unique_nations(4)
+    sbc_solver.set_min_overall_of_squad(min_overall)
+    try:
+        return get_price(sbc_solver.solve())
+    except NoSolutionFound:
+        return None
+
+
+def test_sweep_matches_separate_solves(cards_df):
+    min_overalls = range(84, 94)
+    sbc_solver = EaFcSbcSolver(cards_df, FORMATION)
+    sbc_solver.set_min_unique_nations(4)
+
+    frontier = sbc_solver.sweep_min_overall_of_squad(min_overalls)
+
+    assert [point["price"] for point in frontier] == sorted({point["price"] for point in frontier})
+    for point in frontier:
+        assert point["price"] == get_price(point["cards"])
+        assert point["squad_rating"] >= point["min_overall"]
+        assert point["price"] == solve_min_overall(cards_df, point["min_overall"])
+    # The top of the range is infeasible, it is not kept for later solves
+    highest_min_overall = frontier[-1]["min_overall"]
+    assert highest_min_overall < max(min_overalls)
+    assert solve_min_overall(cards_df, highest_min_overall + 1) is None
+    assert get_price(sbc_solver.solve()) == frontier[-1]["price"]
+
+
+def solve_both(cards_df, spec):
+    """Price from CP-SAT and from the decomposition solver, None if no solution was found"""
+    prices = []
+    for use_decomposition in (False, True):
+        sbc_solver = EaFcSbcSolver(cards_df, FORMATION)
+        for constraint, args in spec:
+            getattr(sbc_solver, f"set_{constraint}")(*args)
+        try:
+            if use_decomposition:
+                cards = sbc_solver._solve_with_decomposition(sbc_solver._create_decomposition_solver(), time.time())
+            else:
+                cards = sbc_solver.solve(use_decomposition=False)
+        except NoSolutionFound:
+            prices.append(None)
+            continue
+        prices.append(get_price(cards))
+    return prices
+
+
+@pytest.mark.parametrize("constraint", sorted(SEPARABLE_CONSTRAINTS))
+def test_decomposition_matches_cp_sat(cards_df, constraint):
+    rng = random.Random(constraint)
+    for _ in range(6):
+        # Random companions keep the state space small enough for the dynamic program
+        companions = rng.sample(sorted(SEPARABLE_CONSTRAINTS.keys() - {constraint}), 2)
+        spec = [(kind, SEPARABLE_CONSTRAINTS[kind](rng, cards_df)) for kind in [constraint] + companions]
+
+        cp_sat_price, decomposition_price = solve_both(cards_df, spec)
+        assert cp_sat_price == decomposition_price, spec
+
+
+@pytest.mark.parametrize("spec", [
+    [("min_overall_of_squad", (95,))],
+    [("min_cards_with_version", ("GOLD", 11)), ("min_overall_of_squad", (92,))],
+    [("min_cards_with_overall", (8, 92)), ("min_cards_with_league", ("League 1", 4))],
+])
+def test_decomposition_reports_infeasible_specs(cards_df, spec):
+    assert solve_both(cards_df, spec) == [None, None]
@@ -0,0 +1,51 @@
+"""FC26DataProvider loading of the bundled players.csv"""
+import pandas as pd
+import pytest
+
+from src.data.fc26_data_provider import FC26DataProvider
+
+PLAYERS = [
+    {"ID": 1, "Name": "Keeper", "Position": "GK", "OverallRating": 70, "Version": "GOLD", "Price": 300,
+     "League": "ENG 1", "Nationality": "England", "Club": "Arsenal", "Futwiz": ""},
+    {"ID": 2, "Name": "Striker", "Position": "ST", "OverallRating": 80, "Version": "RARE GOLD", "Price": 900,
+     "League": "ESP 1", "Nationality": "Spain", "Club": "Real Madrid", "Futwiz": ""},
+]
+
+
+@pytest.fixture
+def provider(tmp_path, monkeypatch):
+    # players.csv is read from the working directory
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("FUTDB_API_KEY", raising=False)
+    pd.DataFrame(PLAYERS).to_csv(tmp_path / "players.csv", index=False)
+    return FC26DataProvider(cache_dir=str(tmp_path / "cache"))
+
+
+def count_ingests(provider, monkeypatch):
+    ingests = []
+    ingest_dump = provider.ingest_dump
+
+    def counting_ingest_dump(*args, **kwargs):
+        ingests.append(args)
+        return ingest_dump(*args, **kwargs)
+
+    monkeypatch.setattr(provider, "ingest_dump", counting_ingest_dump)
+    return ingests
+
+
+def test_csv_is_ingested_once(provider, monkeypatch):
+    ingests = count_ingests(provider, monkeypatch)
+
+    assert sorted(provider.get_players_data(source="csv")["ID"]) == [1, 2]
+    assert sorted(provider.get_players_data(source="csv")["ID"]) == [1, 2]
+    assert sorted(provider.get_players_data(source="auto")["ID"]) == [1, 2]
+    assert len(ingests) == 1
+
+
+@pytest.mark.parametrize("source", ["csv", "auto"])
+def test_changed_csv_is_ingested_again(provider, tmp_path, source):
+    provider.get_players_data(source="csv")
+    new_player = dict(PLAYERS[0], ID=3, Name="Defender", Position="CB")
+    pd.DataFrame(PLAYERS + [new_player]).to_csv(tmp_path / "players.csv", index=False)
+
+    assert sorted(provider.get_players_data(source=source)["ID"]) == [1, 2, 3]
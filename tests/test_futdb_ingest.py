@@ -0,0 +1,223 @@
+"""FutDB ingest against a local HTTP server serving fixture pages"""
+import json
+import os
+import threading
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from src.data.fc26_data_provider import FC26DataProvider
+
+NO_PAGES = 5
+POSITIONS = ["GK", "CB", "ST"]
+# Listed with a price, so no price request is needed
+LISTED_PRICE_ID = 10
+# Price endpoint answers 404, the player is dropped
+UNPRICED_ID = 42
+LEAGUES = {13: "Premier League", 16: "Ligue 1", 53: "LaLiga EA SPORTS"}
+NATIONS = {14: "England", 18: "France"}
+CLUBS = {1: "Arsenal", 2: "Paris SG", 3: "Real Madrid"}
+RARITIES = {1: "Rare", 3: "Team of the Week"}
+
+
+def make_players_page(page):
+    items = []
+    for i, position in enumerate(POSITIONS):
+        player_id = page * 10 + i
+        item = {
+            "id": player_id,
+            "name": f"Player {player_id}",
+            "position": position,
+            "rating": 70 + page + i,
+            "rarity": 1 if i else 3,
+            "league": [13, 16, 53][i],
+            "nation": [14, 18, 14][i],
+            "club": i + 1,
+        }
+        if player_id == LISTED_PRICE_ID:
+            item["price"] = 999
+        items.append(item)
+    return {"pagination": {"pageCurrent": page, "pageTotal": NO_PAGES}, "items": items}
+
+
+def make_names_page(names, page, page_size):
+    ids = sorted(names)
+    page_ids = ids[(page - 1) * page_size:page * page_size]
+    return {
+        "pagination": {"pageCurrent": page, "pageTotal": -(-len(ids) // page_size)},
+        "items": [{"id": entity_id, "name": names[entity_id]} for entity_id in page_ids],
+    }
+
+
+def get_price(player_id):
+    return 1000 + player_id
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    api = None
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        page = int(parse_qs(url.query).get("page", ["1"])[0])
+        request = url.path if url.path.endswith("/price") else f"{url.path}?page={page}"
+        with self.api.lock:
+            self.api.requests[request] += 1
+            attempt = self.api.requests[request]
+
+        if self.headers.get("X-AUTH-TOKEN") != "test-key":
+            self._send_json(401, {"error": "unauthorized"})
+        elif attempt == 1 and request in self.api.rate_limited:
+            self._send_json(429, {"error": "slow down"}, {"Retry-After": "0.05"})
+        elif attempt == 1 and request in self.api.server_errors:
+            self._send_json(503, {"error": "unavailable"})
+        elif attempt == 1 and request in self.api.dropped:
+            # Close the connection without any response
+            self.close_connection = True
+        elif url.path == "/api/players":
+            self._send_json(200, make_players_page(page))
+        elif url.path.startswith("/api/players/"):
+            player_id = int(url.path.split("/")[3])
+            if player_id == UNPRICED_ID:
+                self._send_json(404, {"error": "no price"})
+            else:
+                self._send_json(200, {"ps": {"price": get_price(player_id)}, "xbox": {"price": 1}})
+        elif url.path == "/api/leagues":
+            self._send_json(200, make_names_page(LEAGUES, page, page_size=2))
+        elif url.path == "/api/nations":
+            self._send_json(200, make_names_page(NATIONS, page, page_size=10))
+        elif url.path == "/api/clubs":
+            self._send_json(200, make_names_page(CLUBS, page, page_size=10))
+        elif url.path == "/api/rarities":
+            self._send_json(200, make_names_page(RARITIES, page, page_size=10))
+        else:
+            self._send_json(404, {"error": "not found"})
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, payload, headers=None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class FixtureApi:
+    def __init__(self):
+        self.requests = Counter()
+        self.lock = threading.Lock()
+        # Requests failing on their first attempt only
+        self.rate_limited = {"/api/players?page=2", "/api/players/31/price"}
+        self.server_errors = {"/api/players?page=3", "/api/leagues?page=2"}
+        self.dropped = {"/api/players?page=4", "/api/players/21/price"}
+
+        handler = type("Handler", (FixtureHandler,), {"api": self})
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/api"
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class Killed(Exception):
+    pass
+
+
+@pytest.fixture
+def api():
+    fixture_api = FixtureApi()
+    yield fixture_api
+    fixture_api.close()
+
+
+@pytest.fixture
+def provider(api, tmp_path, monkeypatch):
+    monkeypatch.setenv("FUTDB_API_KEY", "test-key")
+    return create_provider(api, tmp_path)
+
+
+def create_provider(api, tmp_path):
+    provider = FC26DataProvider(cache_dir=str(tmp_path / "cache"), max_concurrent_requests=4,
+                                requests_per_second=1000)
+    provider.futdb_base_url = api.url
+    return provider
+
+
+def expected_ids():
+    return sorted(page * 10 + i for page in range(1, NO_PAGES + 1) for i in range(len(POSITIONS))
+                  if page * 10 + i != UNPRICED_ID)
+
+
+def test_ingest_retries_and_caches_every_page_once(api, provider):
+    df = provider.get_players_data(source="futdb")
+
+    assert sorted(df["ID"]) == expected_ids()
+    # Every flaky request was retried once and then succeeded
+    for request in api.rate_limited | api.server_errors | api.dropped:
+        assert api.requests[request] == 2, request
+    assert all(api.requests[f"/api/players?page={page}"] <= 2 for page in range(1, NO_PAGES + 1))
+
+    cards = df.set_index("ID")
+    assert cards.loc[LISTED_PRICE_ID, "Price"] == 999
+    assert cards.loc[21, "Price"] == get_price(21)
+    # Ids are resolved to names
+    assert cards.loc[10, "League"] == "Premier League"
+    assert cards.loc[12, "League"] == "LaLiga EA SPORTS"
+    assert cards.loc[11, "Nationality"] == "France"
+    assert cards.loc[12, "Club"] == "Real Madrid"
+    # Rarity names are canonical versions, both count as rare cards
+    assert cards.loc[10, "Version"] == "TOTW"
+    assert cards.loc[11, "Version"] == "RARE"
+    assert cards.loc[10, "IsRare"] and cards.loc[11, "IsRare"]
+    assert "SourcePage" not in df.columns
+
+    assert not os.path.exists(provider.ingest_checkpoint_file)
+    # Auto mode now uses the complete cache without fetching again
+    no_requests = sum(api.requests.values())
+    assert sorted(provider.get_players_data(source="auto")["ID"]) == expected_ids()
+    assert sum(api.requests.values()) == no_requests
+
+
+def test_killed_ingest_resumes_from_checkpoint(api, provider, tmp_path, monkeypatch):
+    save_ingest_checkpoint = provider._save_ingest_checkpoint
+    killed = []
+
+    def save_then_kill(checkpoint):
+        # Killed after the third page was appended to the cache but before it was checkpointed,
+        # pages still in flight are never checkpointed either
+        if killed or len(checkpoint["completed_pages"]) == 3:
+            killed.append(True)
+            raise Killed()
+        save_ingest_checkpoint(checkpoint)
+
+    monkeypatch.setattr(provider, "_save_ingest_checkpoint", save_then_kill)
+    with pytest.raises(Killed):
+        provider.get_players_data(source="futdb")
+
+    with open(provider.ingest_checkpoint_file, 'r') as f:
+        completed_pages = json.load(f)["completed_pages"]
+    assert len(completed_pages) == 2
+    requests_before_resume = Counter(api.requests)
+
+    # A fresh process picks the fetch up again in auto mode
+    df = create_provider(api, tmp_path).get_players_data(source="auto")
+
+    assert sorted(df["ID"]) == expected_ids()
+    resumed_requests = api.requests - requests_before_resume
+    for page in range(1, NO_PAGES + 1):
+        assert (f"/api/players?page={page}" in resumed_requests) == (page not in completed_pages), page
+    # Names were kept in the checkpoint
+    assert not any(request.startswith(("/api/leagues", "/api/nations", "/api/clubs", "/api/rarities"))
+                   for request in resumed_requests)
+    assert not os.path.exists(provider.ingest_checkpoint_file)
@@ -0,0 +1,168 @@
+"""Solve server request handling against players.csv"""
+import http.client
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+from src.solve_server.http_solve_server import SbcSolveService, create_server
+
+PLAYERS_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "players.csv")
+FORMATION = ["GK", "CB", "CB", "ST"]
+
+
+class CsvProvider:
+    def __init__(self):
+        self.no_loads = 0
+
+    def get_players_data(self, source="auto", positions=None):
+        self.no_loads += 1
+        df = pd.read_csv(PLAYERS_CSV)
+        return df[df["Position"].isin(positions)].reset_index(drop=True)
+
+
+class GatedProvider(CsvProvider):
+    """Blocks loading cards, and so the first solve, until released"""
+
+    def __init__(self):
+        super().__init__()
+        self.release = threading.Event()
+
+    def get_players_data(self, source="auto", positions=None):
+        self.release.wait(timeout=10)
+        return super().get_players_data(source, positions)
+
+
+class CountingDict(dict):
+    """Counts lookups, every solve request looks up its spec among the solves in flight once"""
+
+    def __init__(self):
+        super().__init__()
+        self.no_gets = 0
+
+    def get(self, key, default=None):
+        self.no_gets += 1
+        return super().get(key, default)
+
+
+def start_server(service):
+    solve_server = create_server(service, port=0)
+    thread = threading.Thread(target=solve_server.serve_forever, daemon=True)
+    thread.start()
+    return solve_server
+
+
+@pytest.fixture
+def server():
+    provider = CsvProvider()
+    solve_server = start_server(SbcSolveService(provider))
+    yield solve_server, provider
+    solve_server.shutdown()
+    solve_server.server_close()
+
+
+@pytest.fixture
+def gated_server():
+    service = SbcSolveService(GatedProvider())
+    service._in_flight = CountingDict()
+    solves = []
+    solve = service._solve
+
+    def counting_solve(spec):
+        solves.append(spec)
+        return solve(spec)
+
+    service._solve = counting_solve
+    solve_server = start_server(service)
+    yield solve_server, service, solves
+    service.provider.release.set()
+    solve_server.shutdown()
+    solve_server.server_close()
+
+
+def post_spec(solve_server, spec):
+    connection = http.client.HTTPConnection(*solve_server.server_address)
+    connection.request("POST", "/solve", body=json.dumps(spec), headers={"Content-Type": "application/json"})
+    response = connection.getresponse()
+    payload = json.loads(response.read())
+    connection.close()
+    return response.status, payload
+
+
+def test_solves_spec_and_keeps_cards_resident(server):
+    solve_server, provider = server
+    spec = {"formation": FORMATION, "constraints": [{"constraint": "min_overall_of_squad", "args": [60]}]}
+
+    for _ in range(2):
+        status, payload = post_spec(solve_server, spec)
+        assert status == 200
+        assert len(payload["cards"]) == len(FORMATION)
+        assert payload["total_price"] == sum(card["Price"] for card in payload["cards"])
+    assert provider.no_loads == 1
+
+
+@pytest.mark.parametrize("spec", [
+    {"formation": FORMATION, "max_time_s": "10"},
+    {"formation": FORMATION, "max_time_s": True},
+    {"formation": FORMATION, "max_time_s": -1},
+    {"formation": 442},
+    {"formation": FORMATION, "constraints": {"constraint": "min_rare_cards", "args": [1]}},
+    {"formation": FORMATION, "constraints": [{"constraint": "min_fun", "args": [1]}]},
+    {"formation": FORMATION, "constraints": [{"constraint": "min_overall_of_squad", "args": ["80"]}]},
+    {"formation": FORMATION, "constraints": [{"constraint": "min_cards_with_nation", "args": [1, "England"]}]},
+    {"formation": FORMATION, "constraints": [{"constraint": "min_rare_cards", "args": [1, 2]}]},
+    {"formation": FORMATION, "timeout": 10},
+])
+def test_malformed_spec_is_rejected(server, spec):
+    solve_server, _ = server
+    status, payload = post_spec(solve_server, spec)
+    assert status == 400, payload
+
+
+def test_unsolvable_spec_is_unprocessable(server):
+    solve_server, _ = server
+    status, payload = post_spec(solve_server, {
+        "formation": FORMATION,
+        "constraints": [{"constraint": "min_cards_with_nation", "args": ["Atlantis", 1]}],
+    })
+    assert status == 422
+    assert payload["type"] == "IncorrectNationName"
+
+
+def post_identical_specs(gated_server, spec, no_requests):
+    """POST spec no_requests times at once, the first solve is held until every request is waiting for it"""
+    solve_server, service, _ = gated_server
+    with ThreadPoolExecutor(max_workers=no_requests) as executor:
+        responses = [executor.submit(post_spec, solve_server, spec) for _ in range(no_requests)]
+        deadline = time.time() + 10
+        while service._in_flight.no_gets < no_requests and time.time() < deadline:
+            time.sleep(0.01)
+        service.provider.release.set()
+        return [response.result() for response in responses]
+
+
+def test_identical_specs_are_solved_once(gated_server):
+    _, _, solves = gated_server
+    spec = {"formation": FORMATION, "constraints": [{"constraint": "min_overall_of_squad", "args": [60]}]}
+
+    responses = post_identical_specs(gated_server, spec, 5)
+
+    assert len(solves) == 1
+    assert [status for status, _ in responses] == [200] * 5
+    assert sorted(payload["metrics"]["coalesced"] for _, payload in responses) == [False] + [True] * 4
+    assert len({json.dumps(payload["cards"]) for _, payload in responses}) == 1
+
+
+def test_error_is_passed_to_every_coalesced_request(gated_server):
+    _, service, solves = gated_server
+    spec = {"formation": FORMATION, "constraints": [{"constraint": "min_cards_with_nation", "args": ["Atlantis", 1]}]}
+
+    responses = post_identical_specs(gated_server, spec, 5)
+
+    assert len(solves) == 1
+    assert [(status, payload["type"]) for status, payload in responses] == [(422, "IncorrectNationName")] * 5
+    assert not service._in_flight
@@ -0,0 +1,109 @@
+"""SolverPortfolio races, cancellation and learning on a tiny model"""
+import json
+import os
+import threading
+
+import pytest
+from ortools.sat.python import cp_model
+
+from src.sbc_solver.portfolio import SolverPortfolio
+
+SPEC_CLASS = "3_players|min_rare_cards|1_cards"
+
+
+class StalledSolver:
+    """Stands in for a configuration that never finishes until the race cancels it"""
+
+    def __init__(self):
+        self.stopped = threading.Event()
+
+    def Solve(self, model):
+        self.stopped.wait(timeout=10)
+        return cp_model.UNKNOWN
+
+    def StopSearch(self):
+        self.stopped.set()
+
+    def StatusName(self, status):
+        return cp_model.CpSolver().StatusName(status)
+
+
+class StubPortfolio(SolverPortfolio):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.created_solvers = []
+
+    def _create_solver(self, configuration_name, max_time_for_solution_s):
+        if configuration_name == "stalled":
+            solver = StalledSolver()
+        else:
+            solver = super()._create_solver(configuration_name, max_time_for_solution_s)
+        self.created_solvers.append((configuration_name, solver))
+        return solver
+
+
+def create_model():
+    model = cp_model.CpModel()
+    cards = [model.NewBoolVar(f"card_{i}") for i in range(5)]
+    model.add(sum(cards) == 3)
+    model.minimize(cp_model.LinearExpr.weighted_sum(cards, [5, 1, 4, 2, 3]))
+    return model
+
+
+@pytest.fixture
+def stats_file(tmp_path):
+    return str(tmp_path / "portfolio_stats.json")
+
+
+def create_portfolio(stats_file):
+    return StubPortfolio(configurations={"one_worker": {"num_workers": 1}, "stalled": {}}, stats_file=stats_file,
+                         min_races_to_learn=2, race_every=10)
+
+
+def test_race_records_win_and_cancels_others(stats_file):
+    portfolio = create_portfolio(stats_file)
+
+    solver, status, configuration_name = portfolio.solve(create_model(), SPEC_CLASS, 10)
+
+    assert status == cp_model.OPTIMAL
+    assert configuration_name == "one_worker"
+    assert solver.ObjectiveValue() == 6
+    stalled_solver = dict(portfolio.created_solvers)["stalled"]
+    assert stalled_solver.stopped.is_set()
+
+    class_stats = portfolio.get_stats()[SPEC_CLASS]
+    assert class_stats["wins"] == {"one_worker": 1}
+    assert len(class_stats["solve_times"]["one_worker"]) == 1
+    # Stats are written through a temporary file which replaces the previous one
+    with open(stats_file, 'r') as f:
+        assert json.load(f) == portfolio.get_stats()
+    assert not os.path.exists(stats_file + ".tmp")
+
+
+def test_learned_configuration_is_used_without_racing(stats_file):
+    portfolio = create_portfolio(stats_file)
+    for _ in range(2):
+        portfolio.solve(create_model(), SPEC_CLASS, 10)
+    assert portfolio.get_learned_configuration(SPEC_CLASS) == "one_worker"
+
+    # A fresh portfolio learns from the stats file
+    portfolio = create_portfolio(stats_file)
+    solver, status, configuration_name = portfolio.solve(create_model(), SPEC_CLASS, 10)
+
+    assert status == cp_model.OPTIMAL
+    assert configuration_name == "one_worker"
+    assert [name for name, _ in portfolio.created_solvers] == ["one_worker"]
+    class_stats = portfolio.get_stats()[SPEC_CLASS]
+    assert class_stats["wins"] == {"one_worker": 2}
+    assert len(class_stats["solve_times"]["one_worker"]) == 3
+
+
+def test_configuration_is_learned_by_solve_time(stats_file):
+    with open(stats_file, 'w') as f:
+        json.dump({SPEC_CLASS: {"solves": 6, "wins": {"one_worker": 2, "stalled": 4},
+                                "solve_times": {"one_worker": [0.2, 0.4], "stalled": [0.1, 0.1, 7.4, 7.0]}}}, f)
+    portfolio = create_portfolio(stats_file)
+
+    # Most wins, but slower on average
+    assert portfolio.get_learned_configuration(SPEC_CLASS) == "one_worker"
+    assert portfolio.get_learned_configuration("unknown_spec_class") is None